@@ -25,46 +25,47 @@ a = Analysis(
     binaries=[],
     datas=[
         (streamlit_path, 'streamlit'),
-        ('*.json', '.'),
-        ('*.csv', '.'),
+        # Data files the app reads; listed explicitly instead of globbing the CWD
+        ('materials.json', '.'),
+        ('sfm_guidelines.json', '.'),
+        ('cams_data.json', '.'),
+        ('davenport_cams.json', '.'),
+        ('gears.json', '.'),
+        ('75_cycle_time_eff_revs_COMPLETE.json', '.'),
+        ('60_cycle_time_eff_revs.json', '.'),
+        ('45_cycle_time_eff_revs.json', '.'),
+        ('drill_sizes.json', '.'),
+        ('threading_charts.json', '.'),
+        ('Threading_Cams.json', '.'),
+        ('tool_definitions.json', '.'),
+        ('config.json', '.'),
+        ('tool_library_end.json', '.'),
+        ('tool_library_side.json', '.'),
     ],
+    # Only what the app imports itself; Streamlit's own dependencies are
+    # found by analysing the streamlit package
     hiddenimports=[
         'streamlit',
-        'streamlit.web.cli', 
+        'streamlit.web.cli',
         'streamlit.runtime',
         'streamlit.runtime.scriptrunner',
         'streamlit.runtime.state',
-        'altair',
-        'plotly',
-        'plotly.graph_objs',
+        'plotly.graph_objects',
         'pandas',
         'numpy',
         'openpyxl',
-        'click',
-        'tornado',
-        'pympler',
-        'validators',
-        'watchdog',
-        'blinker',
-        'cachetools',
-        'importlib_metadata',
-        'packaging',
-        'pillow',
-        'protobuf',
-        'pyarrow',
-        'python_dateutil',
-        'requests',
-        'rich',
-        'tenacity',
-        'toml',
-        'typing_extensions',
-        'tzlocal',
-        'gitpython'
+        'orjson',
     ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # Optional Streamlit extras the app never uses
+    excludes=[
+        'git',
+        'pympler',
+        'rich',
+        'watchdog',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -73,20 +74,18 @@ a = Analysis(
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
+# One-folder build: the bundle is unpacked once at build time instead of
+# being extracted to a temp directory on every launch
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='CAM_Assistant',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
     upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
     console=True,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -94,6 +93,19 @@ exe = EXE(
     cofile=None,
     icon=None,
 )
+
+# No UPX on the collected libraries; compressing the numpy/pyarrow DLLs
+# slows loading and can break them
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='CAM_Assistant',
+)
 '''
     
     # Write spec file
@@ -108,17 +120,20 @@ exe = EXE(
         subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'pyinstaller'])
     
     # Build the executable
+    # -O strips asserts from the bundled bytecode. Don't use -OO: some
+    # libraries read their own docstrings at runtime and break without them.
     print("Building executable (this may take 5-10 minutes)...")
+    env = {**os.environ, 'PYTHONOPTIMIZE': '1'}
     result = subprocess.run([
-        sys.executable, '-m', 'PyInstaller', 
+        sys.executable, '-O', '-m', 'PyInstaller',
         '--clean', 'cam_assistant.spec'
-    ], capture_output=True, text=True)
+    ], capture_output=True, text=True, env=env)
     
     if result.returncode == 0:
         print("✅ Build successful!")
-        print("📁 Executable location: dist/CAM_Assistant.exe")
-        print("📏 File size: ~200-400 MB")
-        print("⏱️  Startup time: 10-30 seconds")
+        print("📁 Executable location: dist/CAM_Assistant/CAM_Assistant.exe")
+        print("📦 Distribute the whole dist/CAM_Assistant folder, not just the .exe")
+        print("⏱️  Startup time: a few seconds (no extraction step)")
     else:
         print("❌ Build failed:")
         print(result.stderr)
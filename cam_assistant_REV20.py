@@ -1,20 +1,48 @@
 import streamlit as st
 import json
 import math
-import pandas as pd
 from io import BytesIO
-import plotly.graph_objects as go
 import numpy as np  # Add this line for 3D simulation
-import plotly.express as px
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, Border, Side
-import os
+# plotly, pandas, openpyxl and scipy are imported inside the functions that use them
+# so the app doesn't pay their import cost before the first paint
+import re
+from bisect import bisect_left
+import mmap
+from collections import defaultdict
+from functools import lru_cache, partial
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+from typing import NamedTuple
+def cdist(a, b, metric='euclidean'):
+    # scipy.spatial is only imported on first use; it is slow to load and most
+    # sessions never need it
+    try:
+        from scipy.spatial.distance import cdist as scipy_cdist
+    except ImportError:
+        # Fallback if scipy is not installed
+        # ||a-b||^2 = ||a||^2 + ||b||^2 - 2a.b keeps the product in BLAS and
+        # skips the (len(a), len(b), d) difference array
+        a = np.ascontiguousarray(a, dtype=np.float64)
+        b = np.ascontiguousarray(b, dtype=np.float64)
+        aa = np.einsum('ij,ij->i', a, a)
+        bb = np.einsum('ij,ij->i', b, b)
+        d2 = aa[:, None] + bb[None, :] - 2.0 * (a @ b.T)
+        np.maximum(d2, 0, out=d2)
+        return np.sqrt(d2)
+    return scipy_cdist(a, b, metric)
+try:
+    from numba import njit
+except ImportError:
+    # Fallback if numba is not installed - run the plain NumPy version
+    def njit(*args, **kwargs):
+        return lambda func: func
 try:
-    from scipy.spatial.distance import cdist
+    import orjson
+    json_loads = orjson.loads
 except ImportError:
-    # Fallback if scipy is not installed
-    def cdist(a, b, metric='euclidean'):
-        return np.sqrt(np.sum((a[:, None] - b[None, :])**2, axis=2))
+    # Fallback if orjson is not installed (json.loads won't take a memoryview)
+    def json_loads(data):
+        return json.loads(bytes(data))
 import time
 
 # --- Cookie manager ---
@@ -23,60 +51,36 @@ from streamlit_cookies_manager import EncryptedCookieManager
 # --- Add import for schematic ---
 #from davenport_schematic import davenport_machine_graphic
 
-# Load tool definitions and config (simplified for Davenport only)
-try:
-    with open("tool_definitions.json", "r") as f:
-        TOOL_DEFINITIONS = json.load(f)
-        # Convert feed_range lists back to tuples
-        for tool_name, tool_data in TOOL_DEFINITIONS.items():
-            if "feed_range" in tool_data:
-                tool_data["feed_range"] = tuple(tool_data["feed_range"])
-    
-    with open("config.json", "r") as f:
-        CONFIG = json.load(f)
-        # Convert string keys to integers for block_setting_ranges
-        if "block_setting_ranges" in CONFIG:
-            CONFIG["block_setting_ranges"] = {int(k): tuple(v) for k, v in CONFIG["block_setting_ranges"].items()}
-except FileNotFoundError:
-    TOOL_DEFINITIONS = {}
-    CONFIG = {}
-
 # JSON Data Loading Functions
+def _parse_json_file(path):
+    """Parse a JSON file straight from a read-only memory map, without a read buffer"""
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap refuses empty files; parse the bytes so the usual JSONDecodeError is raised
+            return json_loads(f.read())
+        with mm:
+            with memoryview(mm) as view:
+                return json_loads(view)
+
 @st.cache_data
 def load_drill_charts():
     """Load drill size charts from JSON"""
     try:
-        with open("drill_sizes.json", "r") as f:
-            return json.load(f)
+        return _parse_json_file("drill_sizes.json")
     except FileNotFoundError:
         st.error("❌ drill_sizes.json not found. Please ensure the file exists.")
         return {}
     except json.JSONDecodeError:
         st.error("❌ Error reading drill_sizes.json. Please check the file format.")
         return {}
-# In your Excel export function, add this section:
-if hasattr(st.session_state, 'cutoff_data') and st.session_state.cutoff_data:
-    # Add cutoff operations sheet
-    cutoff_ws = wb.create_sheet("Cutoff Operations")
-    cutoff_ws.append(["Position", "Wall Thickness", "Feed Rate", "Required Rise", "Recommended Cam"])
-    
-    for pos_key, cutoff_info in st.session_state.cutoff_data.items():
-        position = pos_key.replace("position_", "")
-        best_cam = cutoff_info.get('cam_recommendations', [{}])[0]
-        cutoff_ws.append([
-            position,
-            f"{cutoff_info.get('wall_thickness', 0):.3f}",
-            f"{cutoff_info.get('recommended_feed', 0):.4f}",
-            f"{cutoff_info.get('required_rise', 0):.3f}",
-            best_cam.get('cam_id', 'N/A')
-        ])
 
 @st.cache_data
 def load_threading_charts():
     """Load threading charts from JSON"""
     try:
-        with open("threading_charts.json", "r") as f:
-            return json.load(f)
+        return _parse_json_file("threading_charts.json")
     except FileNotFoundError:
         st.error("❌ threading_charts.json not found. Please ensure the file exists.")
         return {}
@@ -84,45 +88,58 @@ def load_threading_charts():
         st.error("❌ Error reading threading_charts.json. Please check the file format.")
         return {}
 
-def search_drill_sizes(search_term, drill_data):
-    """Enhanced drill size search using JSON data"""
-    results = []
-    search_term = search_term.upper().strip()
-    
-    # Search all drill categories
-    for category_name, drills in drill_data.items():
-        if isinstance(drills, list):
-            for drill in drills:
-                # Search by size name
-                if search_term in drill["size"].upper():
-                    results.append(drill)
-                # Search by decimal value (with tolerance)
-                elif search_term.replace("#", "").replace("MM", "").replace(".", "").isdigit():
-                    try:
-                        search_val = float(search_term.replace("#", "").replace("MM", ""))
-                        if abs(drill["decimal"] - search_val) < 0.001:
-                            results.append(drill)
-                    except ValueError:
-                        continue
-    
-    return results
-
-def search_thread_sizes(search_term, thread_data):
-    """Search threading data"""
-    results = []
+def _build_drill_index(drill_data):
+    """Flatten every drill category into (records, upper-cased sizes, decimals)"""
+    records = [drill for drills in drill_data.values() if isinstance(drills, list) for drill in drills]
+    # Fixed-width str array so np.char.find scans the whole column in C
+    sizes_upper = np.array([drill["size"].upper() for drill in records], dtype=str)
+    decimals = np.array([drill["decimal"] for drill in records], dtype=np.float64)
+    return records, sizes_upper, decimals
+
+@st.cache_resource(show_spinner=False)
+def _drill_index():
+    """_build_drill_index over drill_sizes.json, built once (no argument to hash per search)"""
+    return _build_drill_index(load_drill_charts())
+
+def _build_thread_index(thread_data):
+    """UNC/UNF then metric threads as (records, upper-cased thread names)"""
+    records = thread_data.get("unc_unf_threads", []) + thread_data.get("metric_threads", [])
+    threads_upper = np.array([thread["thread"].upper() for thread in records], dtype=str)
+    return records, threads_upper
+
+@st.cache_resource(show_spinner=False)
+def _thread_index():
+    """_build_thread_index over threading_charts.json, built once"""
+    return _build_thread_index(load_threading_charts())
+
+def search_drill_sizes(search_term, drill_data=None):
+    """Enhanced drill size search using JSON data (drill_sizes.json unless drill_data is given)"""
+    records, sizes_upper, decimals = _drill_index() if drill_data is None else _build_drill_index(drill_data)
     search_term = search_term.upper().strip()
     
-    # Search UNC/UNF threads
-    for thread in thread_data.get("unc_unf_threads", []):
-        if search_term in thread["thread"].upper():
-            results.append(thread)
+    # Parse the term as a decimal size once, up front
+    search_num = None
+    numeric_term = search_term.replace("#", "").replace("MM", "")
+    if numeric_term.replace(".", "").isdigit():
+        try:
+            search_num = float(numeric_term)
+        except ValueError:
+            pass
     
-    # Search metric threads
-    for thread in thread_data.get("metric_threads", []):
-        if search_term in thread["thread"].upper():
-            results.append(thread)
+    # Search by size name
+    mask = np.char.find(sizes_upper, search_term) >= 0
+    # Search by decimal value (with tolerance)
+    if search_num is not None:
+        mask |= np.abs(decimals - search_num) < 0.001
     
-    return results
+    return [records[i] for i in np.flatnonzero(mask)]
+
+def search_thread_sizes(search_term, thread_data=None):
+    """Search threading data (threading_charts.json unless thread_data is given)"""
+    records, threads_upper = _thread_index() if thread_data is None else _build_thread_index(thread_data)
+    search_term = search_term.upper().strip()
+    mask = np.char.find(threads_upper, search_term) >= 0
+    return [records[i] for i in np.flatnonzero(mask)]
 
 # Hardcoded Davenport configuration (simplified)
 DAVENPORT_CONFIG = {
@@ -165,21 +182,41 @@ DEFAULT_TOOLS_END = ["DRILL", "REAMER", "TAP", "DIE HEAD", "CENTER"]
 DEFAULT_TOOLS_SIDE = ["BOXTOOL", "FORM TOOL", "SHAVE", "KNURL", "BROACH"]
 THREADING_TOOLS = ["TAP", "DIE HEAD", "THREAD ROLL"]
 
+# Session-state/widget keys for each spindle position, built once instead of per rerun
+POSITION_FIELDS = (
+    "ew_tool", "ew_travel", "ew_approach", "ew_feed", "ew_tool_desc",
+    "sw_tool", "sw_travel", "sw_approach", "sw_feed", "sw_tool_desc",
+    "largest_dia", "smallest_dia",
+)
+POS_KEYS = {
+    i: {field: f"pos{i}_{field}" for field in POSITION_FIELDS}
+    for i in range(1, DAVENPORT_CONFIG["positions"] + 1)
+}
+
 def save_tool_library(tools, filename):
     """Save tool library to JSON file"""
     with open(filename, 'w') as f:
         json.dump(list(tools), f, indent=2)
 
 def load_tool_library(filename, defaults=None):
-    if os.path.exists(filename):
-        with open(filename) as f:
-            return set(json.load(f))
-    return set(defaults) if defaults else set()
+    try:
+        return set(_parse_json_file(filename))
+    except FileNotFoundError:
+        return set(defaults) if defaults else set()
 
-def tool_selector(label, tools, session_key, lib_key, filename):
+@st.cache_resource(show_spinner=False, max_entries=64)
+def tool_select_options(tools):
+    """Selectbox options for a tool tuple ("", tools..., "Custom...") plus an option -> index lookup"""
     # Filter out any "Custom" entries that might have been added to prevent duplication
-    filtered_tools = [tool for tool in tools if tool.lower() not in ["custom", "custom..."]]
-    tool_options = [""] + list(filtered_tools) + ["Custom..."]
+    filtered_tools = tuple(tool for tool in tools if tool.lower() not in ("custom", "custom..."))
+    tool_options = ("",) + filtered_tools + ("Custom...",)
+    option_index = {}
+    for i, option in enumerate(tool_options):
+        option_index.setdefault(option, i)
+    return tool_options, MappingProxyType(option_index)
+
+def tool_selector(label, tools, session_key, lib_key, filename):
+    tool_options, _ = tool_select_options(tuple(tools))
     selected = st.selectbox(label, tool_options, key=f"{session_key}_select")
     if selected == "Custom...":
         custom_tool = st.text_input("Enter custom tool name:", key=f"{session_key}_custom")
@@ -197,24 +234,18 @@ def tool_selector(label, tools, session_key, lib_key, filename):
     return ""
 
 def enhanced_tool_selector(label, tools, session_key, lib_key, filename, tool_definitions=None):
-    # Filter out any "Custom" entries that might have been added to prevent duplication
-    filtered_tools = [tool for tool in tools if tool.lower() not in ["custom", "custom..."]]
-    tool_options = [""] + list(filtered_tools) + ["Custom..."]
+    tool_options, option_index = tool_select_options(tuple(tools))
     
     # Get previously selected value from session state for persistence
     previous_selection = st.session_state.get(session_key, "")
     
-    # Ensure the previous selection is in the tool_options, otherwise default to empty
-    if previous_selection and previous_selection not in tool_options:
+    # Set the default index based on previous selection, otherwise default to empty
+    default_index = option_index.get(previous_selection, 0)
+    if previous_selection and previous_selection not in option_index:
         # If it was a custom tool, add it to the options (but not if it's a "Custom" variant)
         if previous_selection not in ["", "Custom..."] and previous_selection.lower() not in ["custom"]:
-            tool_options.insert(-1, previous_selection)  # Insert before "Custom..."
-    
-    # Set the default index based on previous selection
-    try:
-        default_index = tool_options.index(previous_selection) if previous_selection in tool_options else 0
-    except ValueError:
-        default_index = 0
+            tool_options = tool_options[:-1] + (previous_selection,) + tool_options[-1:]  # Insert before "Custom..."
+            default_index = len(tool_options) - 2
     
     selected = st.selectbox(label, tool_options, index=default_index, key=f"{session_key}_select")
     
@@ -255,15 +286,15 @@ def enhanced_tool_selector(label, tools, session_key, lib_key, filename, tool_de
         return selected
     return ""
 
+# The loaders below use cache_resource: the parsed data is shared by every
+# session in the process and must be treated as read-only by callers
+@st.cache_resource(show_spinner=False)
 def load_data():
-    with open("materials.json") as f:
-        material_data = json.load(f)
-    with open("sfm_guidelines.json") as f:
-        sfm_guidelines = json.load(f)
+    material_data = _parse_json_file("materials.json")
+    sfm_guidelines = _parse_json_file("sfm_guidelines.json")
     # Load legacy cam data for backward compatibility
     try:
-        with open("cams_data.json") as f:
-            legacy_cam_data = json.load(f)
+        legacy_cam_data = _parse_json_file("cams_data.json")
     except FileNotFoundError:
         legacy_cam_data = {}
     
@@ -272,43 +303,65 @@ def load_data():
     
     return material_data, sfm_guidelines, legacy_cam_data
 
+@st.cache_data(show_spinner=False)
+def load_material_options():
+    """Material names for the setup selectbox plus a name -> index lookup"""
+    material_data = load_data()[0]
+    materials_list = list(material_data.keys())
+    return materials_list, {name: i for i, name in enumerate(materials_list)}
+
+# Used by suggest_davenport_cam when no legacy cam data can be loaded
+DEFAULT_LEGACY_CAMS = MappingProxyType({
+    "5-C-792": {"size": "3/16", "rise": 0.1650, "type": "TURNING", "cut_start": 0, "cut_end": 45, "dwell_end": 50, "total_spaces": 100},
+    "5-C-793": {"size": "1/4", "rise": 0.2000, "type": "TURNING", "cut_start": 0, "cut_end": 45, "dwell_end": 50, "total_spaces": 100},
+    "5-C-794": {"size": "5/16", "rise": 0.2500, "type": "TURNING", "cut_start": 0, "cut_end": 45, "dwell_end": 50, "total_spaces": 100},
+    "5-C-795": {"size": "3/8", "rise": 0.3000, "type": "TURNING", "cut_start": 0, "cut_end": 45, "dwell_end": 50, "total_spaces": 100}
+})
+
+def sort_cams_by_rise(cam_data):
+    """
+    Cams as (rises, cams) sorted by rise, where cams holds (rise, name, size, type)
+    tuples. The sort is stable, so equal rises keep their database order.
+    """
+    cams = sorted(
+        ((cam_info.get("rise", 0), cam_name, cam_info.get("size", "Unknown"), cam_info.get("type", "TURNING"))
+         for cam_name, cam_info in cam_data.items()),
+        key=itemgetter(0))
+    rises = np.fromiter((cam[0] for cam in cams), dtype=np.float64, count=len(cams))
+    rises.setflags(write=False)
+    return rises, tuple(cams)
+
+@st.cache_resource(show_spinner=False)
+def load_legacy_cams_by_rise():
+    """Legacy cam data from load_data(), sorted once by rise for suggest_davenport_cam"""
+    try:
+        legacy_cam_data = load_data()[2]
+    except (OSError, ValueError):
+        legacy_cam_data = {}
+    return sort_cams_by_rise(legacy_cam_data or DEFAULT_LEGACY_CAMS)
+
+def smallest_cam_meeting_rise(rises, cams, rise_needed):
+    """(rise, name, size, type) of the smallest cam whose rise meets rise_needed, or None"""
+    i = int(np.searchsorted(rises, rise_needed, side="left"))
+    return cams[i] if i < len(cams) else None
+
+@st.cache_resource(show_spinner=False, max_entries=1024)
+def legacy_cam_for_rise(rise_needed):
+    """smallest_cam_meeting_rise over the default legacy cams, memoized per exact rise"""
+    return smallest_cam_meeting_rise(*load_legacy_cams_by_rise(), rise_needed)
+
 def suggest_davenport_cam(rise_needed, material_data=None, sfm_guidelines=None, legacy_cam_data=None):
     """Suggest appropriate Davenport cam based on rise needed"""
     
-    # If data not provided, load it
-    if not legacy_cam_data:
-        try:
-            material_data, sfm_guidelines, legacy_cam_data = load_data()
-        except:
-            legacy_cam_data = {}
-    
-    # Add some hardcoded Davenport cams if none exist
+    # If data not provided, use the cached copy sorted by rise
     if not legacy_cam_data:
-        legacy_cam_data = {
-            "5-C-792": {"size": "3/16", "rise": 0.1650, "type": "TURNING", "cut_start": 0, "cut_end": 45, "dwell_end": 50, "total_spaces": 100},
-            "5-C-793": {"size": "1/4", "rise": 0.2000, "type": "TURNING", "cut_start": 0, "cut_end": 45, "dwell_end": 50, "total_spaces": 100},
-            "5-C-794": {"size": "5/16", "rise": 0.2500, "type": "TURNING", "cut_start": 0, "cut_end": 45, "dwell_end": 50, "total_spaces": 100},
-            "5-C-795": {"size": "3/8", "rise": 0.3000, "type": "TURNING", "cut_start": 0, "cut_end": 45, "dwell_end": 50, "total_spaces": 100}
-        }
-    
-    # Find suitable cams
-    suitable_cams = []
-    
-    for cam_name, cam_info in legacy_cam_data.items():
-        cam_rise = cam_info.get("rise", 0)
-        if cam_rise >= rise_needed:
-            suitable_cams.append({
-                "name": cam_name,
-                "rise": cam_rise,
-                "size": cam_info.get("size", "Unknown"),
-                "type": cam_info.get("type", "TURNING")
-            })
-    
-    # Sort by rise (smallest first that meets requirement)
-    suitable_cams.sort(key=lambda x: x["rise"])
+        cam = legacy_cam_for_rise(rise_needed)
+    else:
+        cam = smallest_cam_meeting_rise(*sort_cams_by_rise(legacy_cam_data), rise_needed)
     
-    if suitable_cams:
-        return suitable_cams[0]  # Return the best match
+    if cam is not None:
+        cam_rise, cam_name, cam_size, cam_type = cam
+        return {"name": cam_name, "rise": cam_rise, "size": cam_size, "type": cam_type}
     else:
         # Return a default/custom cam suggestion
         return {
@@ -322,8 +375,7 @@ def suggest_davenport_cam(rise_needed, material_data=None, sfm_guidelines=None,
 def get_threading_cams():
     """Get threading cam data - replacing the old @st.cache_data function"""
     try:
-        with open("threading_cams.json", "r") as f:
-            return json.load(f)
+        return _parse_json_file("threading_cams.json")
     except FileNotFoundError:
         # Return hardcoded threading cams if file not found
         return {
@@ -334,7 +386,14 @@ def get_threading_cams():
         }
 
 def calculate_threading_rise(thread_pitch, num_threads, safety_factor=1.2):
-    """Calculate required rise for threading operation"""
+    """
+    Calculate required rise for threading operation
+    Works element-wise on NumPy arrays, pandas columns and plain lists; scalars stay floats
+    """
+    if isinstance(thread_pitch, (list, tuple)):
+        thread_pitch = np.asarray(thread_pitch, dtype=np.float64)
+    if isinstance(num_threads, (list, tuple)):
+        num_threads = np.asarray(num_threads, dtype=np.float64)
     return thread_pitch * num_threads * safety_factor
 
 
@@ -403,16 +462,17 @@ def calculate_threading_rise(thread_pitch, num_threads, safety_factor=1.2):
     else:
         return f"**Suggested Cam:** {primary_suggestion[0]} (Rise: {best_rise:.4f}\")"
 
+@st.cache_resource(show_spinner=False)
 def load_machine_cam_data():
     """Load Davenport cam database"""
+    # _parse_json_file hands back a fresh object, so adding 5-C-792 below never
+    # touches another caller's copy
     try:
-        with open("davenport_cams.json") as f:
-            cam_data = json.load(f)
+        cam_data = _parse_json_file("davenport_cams.json")
     except FileNotFoundError:
         # Fallback to legacy cam data
         try:
-            with open("cams_data.json") as f:
-                cam_data = json.load(f)
+            cam_data = _parse_json_file("cams_data.json")
         except FileNotFoundError:
             cam_data = {}
     
@@ -421,11 +481,58 @@ def load_machine_cam_data():
     
     return cam_data
 
+def build_cam_index(cam_db):
+    """
+    Group usable cams (rise > 0) by upper-cased cam type for recommend_cam.
+    Each bucket is (names, rises, details) with rises as a NumPy array.
+    """
+    buckets = defaultdict(list)
+    for cam_name, details in cam_db.items():
+        cam_rise = details.get("rise", 0)
+        if cam_rise <= 0:
+            continue
+        cam_type = details.get("type", "").strip().upper()
+        buckets[cam_type].append((cam_name, cam_rise, details))
+    cam_index = {}
+    for cam_type, cams in buckets.items():
+        names, rises, details = zip(*cams)
+        rises = np.fromiter(rises, dtype=np.float64, count=len(rises))
+        rises.setflags(write=False)
+        cam_index[cam_type] = (names, rises, details)
+    # Shared across sessions via load_cam_lookup, so hand out a read-only view
+    return MappingProxyType(cam_index)
+
+def _closest_cam(cam_index, cam_type_target, target_rise, total_travel, min_block, max_block):
+    """Closest-rise cam of the given type whose block setting falls in range, or None"""
+    bucket = cam_index.get(cam_type_target)
+    if bucket is None:
+        return None
+    names, rises, details = bucket
+    blocks = total_travel / rises
+    candidates = np.flatnonzero((blocks >= min_block) & (blocks <= max_block))
+    if candidates.size == 0:
+        return None
+    best = candidates[np.argmin(np.abs(rises[candidates] - target_rise))]
+    return names[best], details[best]
+
+def make_cam_lookup(cam_db):
+    """Index cam_db once and return a memoized closest-cam lookup for recommend_cam"""
+    cam_index = build_cam_index(cam_db)
+    lookup = lru_cache(maxsize=512)(partial(_closest_cam, cam_index))
+    # Kept on the lookup so the SHAVE path can reuse the same index
+    lookup.cam_index = cam_index
+    return lookup
+
+@st.cache_resource(show_spinner=False)
+def load_cam_lookup():
+    """Memoized lookup over the Davenport cam database, kept across reruns"""
+    return make_cam_lookup(load_machine_cam_data())
+
+@st.cache_resource(show_spinner=False)
 def load_gear_table(cpm="75"):
     """Load Davenport gear table"""
     try:
-        with open("gears.json") as f:
-            data = json.load(f)
+        data = _parse_json_file("gears.json")
     except FileNotFoundError:
         # Return empty if no gear file
         return []
@@ -442,6 +549,7 @@ def load_gear_table(cpm="75"):
             return data.get("75", [])
         return data.get(str(cpm), [])
 
+@st.cache_resource(show_spinner=False)
 def load_cycle_time_data(cpm_setting):
     """Load cycle time data from JSON files"""
     cpm_files = {
@@ -454,16 +562,64 @@ def load_cycle_time_data(cpm_setting):
         return None
     
     try:
-        with open(cpm_files[cpm_setting]) as f:
-            return json.load(f)
+        return _parse_json_file(cpm_files[cpm_setting])
     except FileNotFoundError:
         st.warning(f"⚠️ {cpm_files[cpm_setting]} not found")
         return None
 
+@st.cache_resource(show_spinner=False)
+def load_rpm_spindles(cpm_setting):
+    """Sorted spindle RPM column of the manual chart as a read-only NumPy array"""
+    cycle_data = load_cycle_time_data(cpm_setting)
+    if not cycle_data:
+        return None
+    rpm_array = np.asarray(cycle_data["rpm_spindles"], dtype=np.float64)
+    rpm_array.setflags(write=False)
+    return rpm_array
+
 def find_closest_rpm_index(target_rpm, rpm_list):
-    """Find index of closest RPM in the manual chart"""
-    differences = [abs(rpm - target_rpm) for rpm in rpm_list]
-    return differences.index(min(differences))
+    """Find index of closest RPM in the manual chart (rpm_list sorted ascending)"""
+    return closest_size_index(np.asarray(rpm_list, dtype=np.float64), target_rpm)
+
+@st.cache_resource(show_spinner=False)
+def load_feed_gear_table(cpm_setting):
+    """
+    Gear ratios and compound gear configurations that carry effective revolutions,
+    laid out column-wise: numeric fields as NumPy arrays, gear names as tuples, and
+    the revolutions as one (gear, rpm column) array with a mask for short lists
+    """
+    cycle_data = load_cycle_time_data(cpm_setting) or {}
+    gear_rows = []
+    compound_flags = []
+    for key, is_compound in (("gear_ratios", False), ("compound_gear_configurations", True)):
+        for gear_ratio in cycle_data.get(key, []):
+            if "effective_revolutions" in gear_ratio:
+                gear_rows.append(gear_ratio)
+                compound_flags.append(is_compound)
+    
+    # Keep the JSON's own number type (ints in the shipped charts) for the revolutions
+    all_revs = np.array([rev for row in gear_rows for rev in row["effective_revolutions"]])
+    width = max((len(row["effective_revolutions"]) for row in gear_rows), default=0)
+    revs = np.zeros((len(gear_rows), width), dtype=all_revs.dtype if all_revs.size else np.float64)
+    has_revs = np.zeros((len(gear_rows), width), dtype=bool)
+    for i, row in enumerate(gear_rows):
+        row_revs = row["effective_revolutions"]
+        revs[i, :len(row_revs)] = row_revs
+        has_revs[i, :len(row_revs)] = True
+    
+    table = {
+        "effective_revolutions": revs,
+        "has_revolutions": has_revs,
+        "time_seconds": np.array([row["time_seconds"] for row in gear_rows]),
+        "production_per_hour": np.array([row["production_per_hour"] for row in gear_rows]),
+        "is_compound": np.array(compound_flags, dtype=bool),
+    }
+    for column in table.values():
+        column.setflags(write=False)
+    table["driver"] = tuple(row["driver"] for row in gear_rows)
+    for key in ("driven", "driven_compound", "driver_compound"):
+        table[key] = tuple(row.get(key) for row in gear_rows)
+    return MappingProxyType(table)
 
 def find_manual_feed_gears(max_effective_revs, setup_rpm, cpm_setting):
     """
@@ -480,76 +636,43 @@ def find_manual_feed_gears(max_effective_revs, setup_rpm, cpm_setting):
         return None
     
     # Find closest RPM in manual charts
-    rpm_index = find_closest_rpm_index(setup_rpm, cycle_data["rpm_spindles"])
+    rpm_index = find_closest_rpm_index(setup_rpm, load_rpm_spindles(cpm_setting))
     closest_manual_rpm = cycle_data["rpm_spindles"][rpm_index]
     
-    best_matches = []
-    
-    # Check each gear ratio - find closest effective revs match in the RPM column
-    for gear_ratio in cycle_data["gear_ratios"]:
-        # Check if the gear_ratio has effective_revolutions key
-        if "effective_revolutions" not in gear_ratio:
-            continue
-            
-        if rpm_index < len(gear_ratio["effective_revolutions"]):
-            manual_effective_revs = gear_ratio["effective_revolutions"][rpm_index]
-            revs_difference = abs(manual_effective_revs - max_effective_revs)
-            
-            best_matches.append({
-                "manual_cycle_time": gear_ratio["time_seconds"],
-                "manual_effective_revs": manual_effective_revs,
-                "revs_difference": revs_difference,
-                "revs_percentage_diff": (revs_difference / max_effective_revs * 100) if max_effective_revs > 0 else 100,
-                "driver": gear_ratio["driver"],
-                "driven": gear_ratio.get("driven"),
-                "driven_compound": gear_ratio.get("driven_compound"),
-                "driver_compound": gear_ratio.get("driver_compound"),
-                "production_per_hour": gear_ratio["production_per_hour"],
-                "rpm_used": closest_manual_rpm
-            })
-    
-    # Check compound gear configurations if available
-    if "compound_gear_configurations" in cycle_data:
-        for gear_ratio in cycle_data["compound_gear_configurations"]:
-            # Check if the gear_ratio has effective_revolutions key
-            if "effective_revolutions" not in gear_ratio:
-                continue
-                
-            if rpm_index < len(gear_ratio["effective_revolutions"]):
-                manual_effective_revs = gear_ratio["effective_revolutions"][rpm_index]
-                revs_difference = abs(manual_effective_revs - max_effective_revs)
-                
-                best_matches.append({
-                    "manual_cycle_time": gear_ratio["time_seconds"],
-                    "manual_effective_revs": manual_effective_revs,
-                    "revs_difference": revs_difference,
-                    "revs_percentage_diff": (revs_difference / max_effective_revs * 100) if max_effective_revs > 0 else 100,
-                    "driver": gear_ratio["driver"],
-                    "driven": gear_ratio.get("driven"),
-                    "driven_compound": gear_ratio.get("driven_compound"),
-                    "driver_compound": gear_ratio.get("driver_compound"),
-                    "production_per_hour": gear_ratio["production_per_hour"],
-                    "rpm_used": closest_manual_rpm,
-                    "is_compound": True
-                })
-    
-    if not best_matches:
+    gear_table = load_feed_gear_table(cpm_setting)
+    if rpm_index >= gear_table["effective_revolutions"].shape[1]:
+        return None
+    revs_column = gear_table["effective_revolutions"][:, rpm_index]
+    has_revs = gear_table["has_revolutions"][:, rpm_index]
+    if not has_revs.any():
         return None
     
-    # Sort to prefer values at or above calculated effective revs (never under)
-    # Primary: prefer values >= calculated (not under)
-    # Secondary: closest to calculated value
-    def sort_key(match):
-        manual_revs = match["manual_effective_revs"]
-        is_under = manual_revs < max_effective_revs
-        # If under calculated value, add large penalty to sort it last
-        penalty = 999999 if is_under else 0
-        return penalty + match["revs_difference"]
-    
-    best_matches.sort(key=sort_key)
-    return best_matches[0]
+    # Prefer values at or above calculated effective revs (never under):
+    # values under get a large penalty, then closest to calculated value wins
+    revs_difference = np.abs(revs_column - max_effective_revs)
+    penalty = np.where(revs_column < max_effective_revs, 999999, 0)
+    score = np.where(has_revs, penalty + revs_difference, np.inf)
+    best = int(np.argmin(score))
+    
+    manual_effective_revs = revs_column[best].item()
+    difference = abs(manual_effective_revs - max_effective_revs)
+    best_match = {
+        "manual_cycle_time": gear_table["time_seconds"][best].item(),
+        "manual_effective_revs": manual_effective_revs,
+        "revs_difference": difference,
+        "revs_percentage_diff": (difference / max_effective_revs * 100) if max_effective_revs > 0 else 100,
+        "driver": gear_table["driver"][best],
+        "driven": gear_table["driven"][best],
+        "driven_compound": gear_table["driven_compound"][best],
+        "driver_compound": gear_table["driver_compound"][best],
+        "production_per_hour": gear_table["production_per_hour"][best].item(),
+        "rpm_used": closest_manual_rpm
+    }
+    if gear_table["is_compound"][best]:
+        best_match["is_compound"] = True
+    return best_match
 
-def calculate_shave_cam_recommendation(target_rise, total_travel, cam_db, machine_profile=None, position=1):
+def calculate_shave_cam_recommendation(target_rise, total_travel, cam_db, machine_profile=None, position=1, cam_index=None):
     """
     Calculate SHAVE tool cam recommendation using Excel formula:
     =SQRT((C5/2)^2-(C6/2)^2)+.02
@@ -561,51 +684,53 @@ def calculate_shave_cam_recommendation(target_rise, total_travel, cam_db, machin
     # The actual diameter-based calculation will be done in the UI
     # where the user can input largest_dia and smallest_dia
     
-    # For now, return the best FORM cam available
-    form_cams = {name: details for name, details in cam_db.items() 
-                 if details.get("type", "").strip().upper() == "FORM"}
-    
-    if not form_cams:
+    # For now, return the FORM cam closest to target rise
+    if cam_index is None:
+        cam_index = build_cam_index(cam_db)
+    form_cams = cam_index.get("FORM")
+    if form_cams is None:
         return None
-    
-    # Find cam closest to target rise
-    closest = None
-    min_diff = float("inf")
-    
-    for cam_name, details in form_cams.items():
-        cam_rise = details.get("rise", 0)
-        if cam_rise <= 0:
-            continue
-            
-        diff = abs(cam_rise - target_rise)
-        if diff < min_diff:
-            min_diff = diff
-            closest = (cam_name, details)
-    
-    return closest
+    names, rises, details = form_cams
+    i = np.argmin(np.abs(rises - target_rise))
+    return names[i], details[i]
+
+@njit(cache=True)
+def _shave_rise_batch(largest, smallest):
+    """SHAVE cam rise for arrays of diameters (0.02 minimum where largest <= smallest)"""
+    # Excel formula: =SQRT((C5/2)^2-(C6/2)^2)+.02, factored as a difference of
+    # squares so near-equal diameters don't cancel
+    rise = 0.5 * np.sqrt(np.maximum((largest - smallest) * (largest + smallest), 0.0)) + 0.02
+    rise[largest <= smallest] = 0.02
+    return rise
 
 def calculate_shave_cam_rise(largest_dia, smallest_dia):
     """
     Calculate SHAVE cam rise using Excel formula:
     =SQRT((largest_dia/2)^2-(smallest_dia/2)^2)+.02
     """
-    import math
-    
-    if largest_dia <= smallest_dia:
-        return 0.02  # Minimum rise
-    
-    largest_radius = largest_dia / 2
-    smallest_radius = smallest_dia / 2
-    
-    # Excel formula: =SQRT((C5/2)^2-(C6/2)^2)+.02
-    calculated_rise = math.sqrt(largest_radius**2 - smallest_radius**2) + 0.02
-    
-    return calculated_rise
+    return float(_shave_rise_batch(np.array([largest_dia], dtype=np.float64),
+                                   np.array([smallest_dia], dtype=np.float64))[0])
+
+# Tool type -> cam type used by recommend_cam (read-only)
+TOOL_TO_TYPE = MappingProxyType({
+    "BOXTOOL": "TURNING", "BROACH": "TURNING", "CENTER": "TURNING", "COUNTERBORE": "TURNING",
+    "CUSTOM": "TURNING", "DEIHEAD": "TURNING", "DIE HEAD": "TURNING", "DRILL": "TURNING", "HOLLOW MILL": "TURNING",
+    "REAMER": "TURNING", "TAP": "TURNING", "TRIPAN": "TURNING",
+    "CROSS DRILL": "FORM", "CROSS TAP": "FORM", "CUTOFF": "FORM", "FORM TOOL": "FORM",
+    "KNURL": "FORM", "ROLL STAMP": "FORM", "SHAVE": "FORM", "SKIVE": "FORM", "THREAD ROLL": "FORM",
+    "BRASS THREADING": "BRASS THREADING", "STEEL THREADING": "STEEL THREADING"
+})
+MATERIAL_TO_THREAD = MappingProxyType({"360 Brass": "BRASS THREADING", "C260 Brass": "BRASS THREADING", "C464 Naval Brass": "BRASS THREADING"})
+
+def recommend_cam(target_rise, total_travel, tool_type, cam_db, material, position=1, machine_profile=None, cam_lookup=None):
+    # Nothing to match until travel has been entered (the usual state on first render)
+    if total_travel <= 0 or target_rise < 0:
+        return None
 
-def recommend_cam(target_rise, total_travel, tool_type, cam_db, material, position=1, machine_profile=None):
     # Special handling for SHAVE tool - calculate cam using Excel formula
     if tool_type.strip().upper() == "SHAVE":
-        return calculate_shave_cam_recommendation(target_rise, total_travel, cam_db, machine_profile, position)
+        cam_index = cam_lookup.cam_index if cam_lookup is not None else None
+        return calculate_shave_cam_recommendation(target_rise, total_travel, cam_db, machine_profile, position, cam_index)
     
     # Use machine profile if provided, otherwise fall back to legacy BLOCK_SETTING_RANGES
     if machine_profile and "block_ranges" in machine_profile:
@@ -613,136 +738,104 @@ def recommend_cam(target_rise, total_travel, tool_type, cam_db, material, positi
     else:
         min_block, max_block = BLOCK_SETTING_RANGES.get(position, (0.8, 1.2))
     
-    tool_to_type = {
-        "BOXTOOL": "TURNING", "BROACH": "TURNING", "CENTER": "TURNING", "COUNTERBORE": "TURNING",
-        "CUSTOM": "TURNING", "DEIHEAD": "TURNING", "DIE HEAD": "TURNING", "DRILL": "TURNING", "HOLLOW MILL": "TURNING",
-        "REAMER": "TURNING", "TAP": "TURNING", "TRIPAN": "TURNING",
-        "CROSS DRILL": "FORM", "CROSS TAP": "FORM", "CUTOFF": "FORM", "FORM TOOL": "FORM",
-        "KNURL": "FORM", "ROLL STAMP": "FORM", "SHAVE": "FORM", "SKIVE": "FORM", "THREAD ROLL": "FORM",
-        "BRASS THREADING": "BRASS THREADING", "STEEL THREADING": "STEEL THREADING"
-    }
-    material_to_thread = {"360 Brass": "BRASS THREADING", "C260 Brass": "BRASS THREADING", "C464 Naval Brass": "BRASS THREADING"}
-    cam_type_target = tool_to_type.get(tool_type.strip().upper())
-    if tool_type in ["TAP", "DIE HEAD", "THREAD ROLL"] and material in material_to_thread:
-        cam_type_target = material_to_thread[material]
+    cam_type_target = TOOL_TO_TYPE.get(tool_type.strip().upper())
+    if tool_type in ["TAP", "DIE HEAD", "THREAD ROLL"] and material in MATERIAL_TO_THREAD:
+        cam_type_target = MATERIAL_TO_THREAD[material]
     if not cam_type_target:
         return None
-    closest = None
-    min_diff = float("inf")
-    for cam_name, details in cam_db.items():
-        cam_type = details.get("type", "").strip().upper()
-        cam_rise = details.get("rise", 0)
-        if cam_type != cam_type_target or cam_rise <= 0:
-            continue
-        block_setting = total_travel / cam_rise
-        if not (min_block <= block_setting <= max_block):
-            continue
-        diff = abs(cam_rise - target_rise)
-        if diff < min_diff:
-            min_diff = diff
-            closest = (cam_name, details)
-    return closest
+    if cam_lookup is None:
+        return _closest_cam(build_cam_index(cam_db), cam_type_target, target_rise, total_travel, min_block, max_block)
+    return cam_lookup(cam_type_target, target_rise, total_travel, min_block, max_block)
+
+# Official Davenport manual threading gear configurations (read-only, shared by every caller)
+THREADING_GEARS = MappingProxyType({
+    "6:1": MappingProxyType({
+        "description": "6:1 Threading (Steel) - Most Common",
+        "gear_ratios": [
+            {"driver": 32, "driven": 32, "description": "Main spindle ratio 1:1"},
+            {"driver": 21, "driven": 28, "description": "Threading spindle ratio 0.75:1"}
+        ],
+        "combined_ratio": 0.75,
+        "rpm_formula": "Work RPM × 0.75",
+        "cam_spaces": "0 to 32.5 hundredths (65% of cycle)",
+        "typical_applications": ["Steel threading", "Standard die heads", "Most threading operations"]
+    }),
+    "2:1": MappingProxyType({
+        "description": "2:1 Threading (Brass) - High Speed",
+        "gear_ratios": [
+            {"driver": 36, "driven": 27, "description": "Threading spindle ratio 1.333:1"}
+        ],
+        "combined_ratio": 1.333,
+        "rpm_formula": "Work RPM × 1.333",
+        "cam_spaces": "0 to 25 hundredths (50% of cycle)",
+        "typical_applications": ["Brass threading", "High-speed operations", "Short threads"]
+    }),
+    "4:1": MappingProxyType({
+        "description": "4:1 Threading (Hybrid) - Half Speed",
+        "gear_ratios": [
+            {"driver": "Variable", "driven": "Variable", "description": "Half-speed method"}
+        ],
+        "combined_ratio": 0.5,
+        "rpm_formula": "Work RPM × 0.5",
+        "cam_spaces": "0 to 25 hundredths (50% of cycle)",
+        "typical_applications": ["Deep threading", "Long threads", "Special applications"]
+    })
+})
 
 def get_manual_threading_gears(threading_method, cpm_setting=75):
     """
     Return official Davenport manual threading gear configurations
     Based on pages 135-151 of the Davenport instruction manual
     """
-    
-    # Official Davenport manual threading gear configurations
-    threading_gears = {
-        "6:1": {
-            "description": "6:1 Threading (Steel) - Most Common",
-            "gear_ratios": [
-                {"driver": 32, "driven": 32, "description": "Main spindle ratio 1:1"},
-                {"driver": 21, "driven": 28, "description": "Threading spindle ratio 0.75:1"}
-            ],
-            "combined_ratio": 0.75,
-            "rpm_formula": "Work RPM × 0.75",
-            "cam_spaces": "0 to 32.5 hundredths (65% of cycle)",
-            "typical_applications": ["Steel threading", "Standard die heads", "Most threading operations"]
-        },
-        "2:1": {
-            "description": "2:1 Threading (Brass) - High Speed",
-            "gear_ratios": [
-                {"driver": 36, "driven": 27, "description": "Threading spindle ratio 1.333:1"}
-            ],
-            "combined_ratio": 1.333,
-            "rpm_formula": "Work RPM × 1.333",
-            "cam_spaces": "0 to 25 hundredths (50% of cycle)",
-            "typical_applications": ["Brass threading", "High-speed operations", "Short threads"]
-        },
-        "4:1": {
-            "description": "4:1 Threading (Hybrid) - Half Speed",
-            "gear_ratios": [
-                {"driver": "Variable", "driven": "Variable", "description": "Half-speed method"}
-            ],
-            "combined_ratio": 0.5,
-            "rpm_formula": "Work RPM × 0.5",
-            "cam_spaces": "0 to 25 hundredths (50% of cycle)",
-            "typical_applications": ["Deep threading", "Long threads", "Special applications"]
-        }
-    }
-    
-    # Return the specific threading method requested
-    return threading_gears.get(threading_method, threading_gears["6:1"])
+    return THREADING_GEARS.get(threading_method, THREADING_GEARS["6:1"])
 
 def get_all_threading_gears():
     """
     Return all threading gear configurations as a dictionary
     Helper function for code that needs access to all methods
     """
-    
-    return {
-        "6:1": get_manual_threading_gears("6:1"),
-        "2:1": get_manual_threading_gears("2:1"),
-        "4:1": get_manual_threading_gears("4:1")
-    }
+    return THREADING_GEARS
 
+class ThreadingRecommendation(NamedTuple):
+    """Threading method suggestion; lower priority values are shown first"""
+    method: str
+    priority: int
+    reason: str
+
+# Material-based threading recommendations (static, so built once)
+BRASS_MATERIAL_RE = re.compile(r"brass|360|c260", re.IGNORECASE)
+BRASS_THREADING_RECOMMENDATIONS = (
+    ThreadingRecommendation("2:1", 1, "Brass material - high speed threading method recommended"),
+    ThreadingRecommendation("6:1", 2, "Alternative for brass if 2:1 too aggressive"),
+)
+STEEL_THREADING_RECOMMENDATIONS = (
+    ThreadingRecommendation("6:1", 1, "Steel material - standard 6:1 method recommended"),
+)
+
+@st.cache_resource(show_spinner=False, max_entries=64)
 def get_threading_method_recommendation(material="Steel", thread_length=0.375, tpi=24.0):
     """
     Recommend threading method based on material and threading requirements
-    Following Davenport manual guidelines
+    Following Davenport manual guidelines (cached per inputs; returns a shared, read-only tuple)
     """
     
-    recommendations = []
-    
     # Material-based recommendations
-    if "brass" in material.lower() or "360" in material or "c260" in material.lower():
-        recommendations.append({
-            "method": "2:1",
-            "priority": 1,
-            "reason": "Brass material - high speed threading method recommended"
-        })
-        recommendations.append({
-            "method": "6:1", 
-            "priority": 2,
-            "reason": "Alternative for brass if 2:1 too aggressive"
-        })
+    if BRASS_MATERIAL_RE.search(material):
+        recommendations = list(BRASS_THREADING_RECOMMENDATIONS)
     else:
-        recommendations.append({
-            "method": "6:1",
-            "priority": 1, 
-            "reason": "Steel material - standard 6:1 method recommended"
-        })
+        recommendations = list(STEEL_THREADING_RECOMMENDATIONS)
     
     # Thread length considerations
     if thread_length > 0.5:
-        recommendations.append({
-            "method": "4:1",
-            "priority": 2,
-            "reason": f"Long thread length ({thread_length:.3f}\") - consider half-speed method"
-        })
+        recommendations.append(ThreadingRecommendation(
+            "4:1", 2, f"Long thread length ({thread_length:.3f}\") - consider half-speed method"))
     
     # Fine pitch considerations  
     if tpi > 32:
-        recommendations.append({
-            "method": "4:1",
-            "priority": 2,
-            "reason": f"Fine pitch ({tpi:.1f} TPI) - half-speed for precision"
-        })
+        recommendations.append(ThreadingRecommendation(
+            "4:1", 2, f"Fine pitch ({tpi:.1f} TPI) - half-speed for precision"))
     
-    return sorted(recommendations, key=lambda x: x["priority"])
+    return tuple(sorted(recommendations, key=attrgetter("priority")))
 
 def calculate_cpm_from_cycle_time(cycle_time_seconds):
     """Calculate Cycles Per Minute from cycle time in seconds"""
@@ -756,67 +849,104 @@ def calculate_cycle_time_from_cpm(cpm):
         return 0
     return 60.0 / cpm
 
+# Default standard CPM rates (display order), plus the same rates sorted for bisecting
+STANDARD_CPMS = (75, 60, 45)
+STANDARD_CPMS_ASCENDING = tuple(sorted(STANDARD_CPMS))
+
+def closest_standard_cpm(cpm, rates=STANDARD_CPMS):
+    """Closest rate to cpm, found by bisecting the sorted rates (ties go to the higher rate)"""
+    ascending = STANDARD_CPMS_ASCENDING if rates is STANDARD_CPMS else sorted(rates)
+    i = bisect_left(ascending, cpm)
+    neighbours = ascending[max(0, i - 1):i + 1]
+    return min(reversed(neighbours), key=lambda x: abs(x - cpm))
+
 def validate_cycle_time_cpm(cycle_time_seconds, machine_profile=None):
     """Validate cycle time against standard machine CPM rates"""
-    cpm = calculate_cpm_from_cycle_time(cycle_time_seconds)
-    
-    # Default standard CPM rates
-    standard_cpms = [75, 60, 45]
+    standard_cpms = STANDARD_CPMS
     
     # Use machine-specific rates if available
     if machine_profile and "cycle_rates" in machine_profile:
         standard_cpms = machine_profile["cycle_rates"]
     
+    # Reruns with an unchanged cycle time reuse the last result for this session
+    cache = st.session_state.setdefault("_cycle_cpm_validation", {})
+    cache_key = (cycle_time_seconds, tuple(standard_cpms))
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    cpm = calculate_cpm_from_cycle_time(cycle_time_seconds)
+    
     # Find closest standard CPM
-    closest_cpm = min(standard_cpms, key=lambda x: abs(x - cpm))
+    closest_cpm = closest_standard_cpm(cpm, standard_cpms)
     difference = abs(closest_cpm - cpm)
     
-    return {
+    validation = {
         "calculated_cpm": cpm,
         "closest_standard_cpm": closest_cpm,
         "difference": difference,
         "is_standard": difference < 2.0,  # Within 2 CPM tolerance
         "standard_cpms": standard_cpms
     }
+    if len(cache) >= 256:
+        cache.clear()
+    cache[cache_key] = validation
+    return validation
+
+# Common metric collet sizes (mm), ascending, with a parallel read-only diameter array
+METRIC_COLLET_LABELS = ("3mm", "4mm", "5mm", "6mm", "8mm", "10mm", "12mm", "16mm", "20mm", "25mm")
+METRIC_COLLET_DIAS = np.array([3.0, 4.0, 5.0, 6.0, 8.0, 10.0, 12.0, 16.0, 20.0, 25.0])
+METRIC_COLLET_DIAS.setflags(write=False)
+
+# Common fractional collet sizes (inches), ascending
+FRACTION_COLLET_LABELS = (
+    "1/16", "3/32", "1/8", "5/32", "3/16", "7/32", "1/4", "9/32",
+    "5/16", "11/32", "3/8", "13/32", "7/16", "15/32", "1/2", "17/32",
+    "9/16", "19/32", "5/8", "11/16", "3/4", "13/16", "7/8", "15/16",
+    "1", "1-1/8", "1-1/4", "1-3/8", "1-1/2", "1-5/8", "1-3/4", "2"
+)
+FRACTION_COLLET_DIAS = np.array([
+    0.0625, 0.09375, 0.125, 0.15625, 0.1875, 0.21875, 0.25, 0.28125,
+    0.3125, 0.34375, 0.375, 0.40625, 0.4375, 0.46875, 0.5, 0.53125,
+    0.5625, 0.59375, 0.625, 0.6875, 0.75, 0.8125, 0.875, 0.9375,
+    1.0, 1.125, 1.25, 1.375, 1.5, 1.625, 1.75, 2.0
+])
+FRACTION_COLLET_DIAS.setflags(write=False)
 
+def closest_size_index(sizes, value):
+    """Index of the entry in an ascending size array closest to value (ties go to the smaller size)"""
+    i = int(np.searchsorted(sizes, value))
+    if i == 0:
+        return 0
+    if i == len(sizes):
+        return len(sizes) - 1
+    return i - 1 if abs(sizes[i - 1] - value) <= abs(sizes[i] - value) else i
+
+# Fractional collet label for every 1/128" step up to the largest collet. The sizes are all
+# multiples of 1/32", so the halfway points between neighbours fall on 1/64" marks and every
+# diameter in ((k - 1)/128, k/128] has the same closest collet as k/128 (ties still go smaller)
+FRACTION_COLLET_BY_128TH = tuple(
+    FRACTION_COLLET_LABELS[closest_size_index(FRACTION_COLLET_DIAS, k / 128)]
+    for k in range(int(FRACTION_COLLET_DIAS[-1] * 128) + 1)
+)
+
+@st.cache_resource(show_spinner=False, max_entries=512)
 def suggest_collet(diameter, shape, units="in"):
     """Suggest appropriate collet based on diameter, shape, and units"""
     
     if units == "mm":
-        # Convert mm to inches for calculations
-        dia_inches = diameter / 25.4
-        
-        # Common metric collet sizes
-        metric_collets = [
-            (3.0, "3mm"), (4.0, "4mm"), (5.0, "5mm"), (6.0, "6mm"), (8.0, "8mm"), 
-            (10.0, "10mm"), (12.0, "12mm"), (16.0, "16mm"), (20.0, "20mm"), (25.0, "25mm")
-        ]
-        
         # Find closest metric collet
-        closest_metric = min(metric_collets, key=lambda x: abs(x[0] - diameter))
-        suggestion = f"{closest_metric[1]} RD" if shape == "Round" else f"{closest_metric[1]} {shape.upper()}"
-        
+        label = METRIC_COLLET_LABELS[closest_size_index(METRIC_COLLET_DIAS, diameter)]
     else:
-        # Imperial fractional collets
-        dia_inches = diameter
-        
-        # Common fractional sizes
-        fractions = [
-            (0.0625, "1/16"), (0.09375, "3/32"), (0.125, "1/8"), (0.15625, "5/32"),
-            (0.1875, "3/16"), (0.21875, "7/32"), (0.25, "1/4"), (0.28125, "9/32"),
-            (0.3125, "5/16"), (0.34375, "11/32"), (0.375, "3/8"), (0.40625, "13/32"),
-            (0.4375, "7/16"), (0.46875, "15/32"), (0.5, "1/2"), (0.53125, "17/32"),
-            (0.5625, "9/16"), (0.59375, "19/32"), (0.625, "5/8"), (0.6875, "11/16"),
-            (0.75, "3/4"), (0.8125, "13/16"), (0.875, "7/8"), (0.9375, "15/16"),
-            (1.0, "1"), (1.125, "1-1/8"), (1.25, "1-1/4"), (1.375, "1-3/8"),
-            (1.5, "1-1/2"), (1.625, "1-5/8"), (1.75, "1-3/4"), (2.0, "2")
-        ]
-        
-        # Find closest fractional size
-        closest_fraction = min(fractions, key=lambda x: abs(x[0] - dia_inches))
-        suggestion = f"{closest_fraction[1]} RD" if shape == "Round" else f"{closest_fraction[1]} {shape.upper()}"
+        # Closest fractional size, read straight from the 1/128" table
+        k = min(max(math.ceil(diameter * 128), 0), len(FRACTION_COLLET_BY_128TH) - 1)
+        label = FRACTION_COLLET_BY_128TH[k]
     
-    return suggestion
+    return f"{label} RD" if shape == "Round" else f"{label} {shape.upper()}"
+
+def set_widget_value(widget_key, value):
+    """Button callback that writes a value into another widget's session state"""
+    st.session_state[widget_key] = value
 
 def suggest_burr_collet(diameter, shape, units="in"):
     """Suggest burr collet - typically same size as main collet for most applications"""
@@ -825,11 +955,76 @@ def suggest_burr_collet(diameter, shape, units="in"):
     # Use the same suggestion logic as the main collet
     return suggest_collet(diameter, shape, units)
 
+# Job setup values used when nothing has been stored yet. Defaults that depend on
+# other inputs (collets, RPM, SFM, material) stay next to their widgets.
+SETUP_DEFAULTS = MappingProxyType({
+    "machine_capacity": "Standard Machine",
+    "units": "in",
+    "job_name": "44153-36-99",
+    "bar_shape": "Round",
+    "dia": 0.3125,
+    "part_length": 0.0,
+    "cutoff": 0.069,
+    "faceoff": 0.0,
+    "set_pads": "",
+    "bar_len": 144.0,
+    "remnant": 6.0,
+    "spindle_gears": "44-20",
+    "feed_gears": "50-30-60",
+    "thread_gears": "",
+    "cycle_time": 1.6,
+    "machine_code": "A,B,O",
+})
+
+# RPM = SFM * 12 / (pi * diameter in inches)
+SFM_TO_RPM = 12.0 / math.pi
+
+# Davenport machine capacities by bar shape
+CAPACITY_OPTIONS = MappingProxyType({
+    "Standard Machine": MappingProxyType({
+        "round": "7/8\"",
+        "hex": "3/4\"",
+        "square": "5/16\"",
+        "description": "Standard Davenport capacity"
+    }),
+    "Oversized Machine": MappingProxyType({
+        "round": "13/16\"",
+        "hex": "11/16\"",
+        "square": "9/16\"",
+        "description": "Oversized Davenport capacity"
+    })
+})
+CAPACITY_KEYS = tuple(CAPACITY_OPTIONS)
+UNITS_OPTIONS = ("in", "mm")
+BAR_SHAPES = ("Round", "Hex", "Special", "Tube", "Square")
+_EMPTY_MATERIAL = MappingProxyType({})  # Fallback for materials missing from materials.json
+
+def unit_number_input(label, units, value, step, format, key, min_value=None, max_value=None,
+                      mm_min_value=None, mm_step=None, mm_format=None):
+    """Number input shown in the selected units; value, limits and the result are in inches.
+    
+    The mm widget uses key + "_mm", scales the limits by 25.4 unless mm_min_value is given,
+    and takes mm_step/mm_format where they differ from the inch widget."""
+    if units != "mm":
+        return st.number_input(f"{label} (in)", min_value=min_value, max_value=max_value, value=value,
+                               step=step, format=format, key=key)
+    if mm_min_value is None and min_value is not None:
+        mm_min_value = min_value * 25.4
+    mm_max_value = max_value * 25.4 if max_value is not None else None
+    value_mm = value * 25.4
+    if mm_min_value is not None:
+        value_mm = max(value_mm, mm_min_value)
+    if mm_max_value is not None:
+        value_mm = min(value_mm, mm_max_value)
+    value_mm = st.number_input(f"{label} (mm)", min_value=mm_min_value, max_value=mm_max_value, value=value_mm,
+                               step=mm_step or step, format=mm_format or format, key=f"{key}_mm")
+    return value_mm / 25.4  # Convert to inches for internal calculations
+
 def job_setup_section(material_data, sfm_guidelines):
     st.header("Job Setup – Multi-Spindle CAM Machine")
     
-    # Get stored setup data if available
-    setup_data_stored = st.session_state.get("setup_data", {})
+    # Get stored setup data if available, layered over the static defaults
+    setup_data_stored = {**SETUP_DEFAULTS, **st.session_state.get("setup_data", {})}
     
     # Simplified to Davenport only for now
     machine_type = "Davenport Model B"
@@ -843,38 +1038,26 @@ def job_setup_section(material_data, sfm_guidelines):
     machine_capacity = None
     if "Davenport" in machine_type:
         st.markdown("#### 🔧 Machine Capacity")
-        capacity_options = {
-            "Standard Machine": {
-                "round": "7/8\"",
-                "hex": "3/4\"", 
-                "square": "5/16\"",
-                "description": "Standard Davenport capacity"
-            },
-            "Oversized Machine": {
-                "round": "13/16\"",
-                "hex": "11/16\"",
-                "square": "9/16\"", 
-                "description": "Oversized Davenport capacity"
-            }
-        }
         
         # Use narrower column layout for the selectbox
         capacity_col1, capacity_col2 = st.columns([1, 2])
         with capacity_col1:
             # Handle machine capacity selection with stored value
-            capacity_keys = list(capacity_options.keys())
-            stored_machine_capacity = setup_data_stored.get("machine_capacity", capacity_keys[0])
-            capacity_index = capacity_keys.index(stored_machine_capacity) if stored_machine_capacity in capacity_keys else 0
+            stored_machine_capacity = setup_data_stored["machine_capacity"]
+            try:
+                capacity_index = CAPACITY_KEYS.index(stored_machine_capacity)
+            except ValueError:
+                capacity_index = 0
             machine_capacity = st.selectbox(
                 "Select Machine Capacity",
-                capacity_keys,
+                CAPACITY_KEYS,
                 index=capacity_index,
                 key="davenport_capacity",
                 help="Choose machine capacity based on your Davenport configuration"
             )
             
             # Display capacity info aligned under the dropdown in the same column
-            selected_capacity = capacity_options[machine_capacity]
+            selected_capacity = CAPACITY_OPTIONS[machine_capacity]
             
             # Use smaller columns within the left column for alignment
             sub_col1, sub_col2, sub_col3 = st.columns([1, 1, 1])
@@ -891,10 +1074,12 @@ def job_setup_section(material_data, sfm_guidelines):
     units_col1, units_col2 = st.columns([1, 3])
     with units_col1:
         # Handle units selection with stored value
-        units_options = ["in", "mm"]
-        stored_units = setup_data_stored.get("units", "in")
-        units_index = units_options.index(stored_units) if stored_units in units_options else 0
-        units = st.selectbox("Units", units_options, index=units_index, key="setup_units", help="Select measurement units")
+        stored_units = setup_data_stored["units"]
+        try:
+            units_index = UNITS_OPTIONS.index(stored_units)
+        except ValueError:
+            units_index = 0
+        units = st.selectbox("Units", UNITS_OPTIONS, index=units_index, key="setup_units", help="Select measurement units")
     with units_col2:
         if units == "mm":
             st.caption("🔄 All measurements will be in millimeters. Machine calculations remain in inches internally.")
@@ -903,135 +1088,100 @@ def job_setup_section(material_data, sfm_guidelines):
     
     col1, col2 = st.columns(2)
     with col1:
-        # Get values from session state if available, otherwise use defaults
-        setup_data_stored = st.session_state.get("setup_data", {})
-        
-        job_name = st.text_input("Part Number", value=setup_data_stored.get("job_name", "44153-36-99"), key="setup_job_name")
+        job_name = st.text_input("Part Number", value=setup_data_stored["job_name"], key="setup_job_name")
         
         # Handle material selection with proper index
-        materials_list = list(material_data.keys())
-        stored_material = setup_data_stored.get("material", materials_list[0])
-        material_index = materials_list.index(stored_material) if stored_material in materials_list else 0
+        materials_list, material_indexes = load_material_options()
+        material_index = material_indexes.get(setup_data_stored.get("material"), 0)
         material = st.selectbox("Material", materials_list, index=material_index, key="setup_material")
+        material_entry = material_data.get(material) or _EMPTY_MATERIAL
+        material_sfm = material_entry.get("sfm", 300)  # Use 300 as reasonable fallback
+        material_density = material_entry.get("density", 0.307)
         
         # Handle bar shape selection with proper index
-        bar_shapes = ["Round", "Hex", "Special", "Tube", "Square"]
-        stored_shape = setup_data_stored.get("bar_shape", "Round")
-        shape_index = bar_shapes.index(stored_shape) if stored_shape in bar_shapes else 0
-        bar_shape = st.selectbox("Bar Shape", bar_shapes, index=shape_index, key="setup_shape")
+        stored_shape = setup_data_stored["bar_shape"]
+        try:
+            shape_index = BAR_SHAPES.index(stored_shape)
+        except ValueError:
+            shape_index = 0
+        bar_shape = st.selectbox("Bar Shape", BAR_SHAPES, index=shape_index, key="setup_shape")
         
         # Enhanced diameter input with 4 decimal places and unit conversion
-        stored_dia = setup_data_stored.get("dia", 0.3125)
+        stored_dia = setup_data_stored["dia"]
         # Ensure stored diameter meets minimum requirement
         stored_dia = max(stored_dia, 0.1000) if stored_dia > 0 else 0.3125
+        dia = unit_number_input("Bar Diameter", units, stored_dia, step=0.0001, format="%.4f", key="setup_dia",
+                                min_value=0.1000, max_value=2.0000)
         if units == "mm":
-            stored_dia_mm = stored_dia * 25.4 if stored_dia else 7.9375
-            stored_dia_mm = max(stored_dia_mm, 2.54)
-            dia_mm = st.number_input("Bar Diameter (mm)", min_value=2.54, max_value=50.8, value=stored_dia_mm, step=0.0001, format="%.4f", key="setup_dia_mm")
-            dia = dia_mm / 25.4  # Convert to inches for internal calculations
             st.caption(f"💡 Diameter in inches: {dia:.4f}\"")
         else:
-            dia = st.number_input("Bar Diameter (in)", min_value=0.1000, max_value=2.0000, value=stored_dia, step=0.0001, format="%.4f", key="setup_dia")
             st.caption(f"💡 Diameter in mm: {dia * 25.4:.4f} mm")
         
         # Enhanced part length with unit conversion
-        stored_part_length = setup_data_stored.get("part_length", 0.0)
+        stored_part_length = setup_data_stored["part_length"]
         # Ensure stored value meets minimum requirement
         stored_part_length = max(stored_part_length, 0.001) if stored_part_length > 0 else 0.001
-        if units == "mm":
-            stored_part_length_mm = stored_part_length * 25.4 if stored_part_length else 0.025
-            stored_part_length_mm = max(stored_part_length_mm, 0.025)
-            part_length_mm = st.number_input("Part Length (mm)", min_value=0.025, value=stored_part_length_mm, step=0.001, format="%.3f", key="setup_part_len_mm")
-            part_length = part_length_mm / 25.4
-        else:
-            part_length = st.number_input("Part Length (in)", min_value=0.001, value=stored_part_length, step=0.001, format="%.3f", key="setup_part_len")
+        part_length = unit_number_input("Part Length", units, stored_part_length, step=0.001, format="%.3f", key="setup_part_len",
+                                        min_value=0.001, mm_min_value=0.025)
         
         # Enhanced cutoff and faceoff with unit conversion
-        stored_cutoff = setup_data_stored.get("cutoff", 0.069)
-        stored_faceoff = setup_data_stored.get("faceoff", 0.0)
+        stored_cutoff = setup_data_stored["cutoff"]
+        stored_faceoff = setup_data_stored["faceoff"]
         # Ensure stored values meet minimum requirements
         stored_cutoff = max(stored_cutoff, 0.010) if stored_cutoff > 0 else 0.069
         stored_faceoff = max(stored_faceoff, 0.000)  # faceoff can be 0.000
-        if units == "mm":
-            stored_cutoff_mm = stored_cutoff * 25.4 if stored_cutoff else 1.753
-            stored_faceoff_mm = stored_faceoff * 25.4 if stored_faceoff else 0.0
-            stored_cutoff_mm = max(stored_cutoff_mm, 0.254)
-            stored_faceoff_mm = max(stored_faceoff_mm, 0.000)
-            cutoff_mm = st.number_input("Cutoff Width (mm)", min_value=0.254, step=0.001, value=stored_cutoff_mm, format="%.3f", key="setup_cutoff_mm")
-            cutoff = cutoff_mm / 25.4
-            faceoff_mm = st.number_input("Faceoff Amount (mm)", min_value=0.000, step=0.001, value=stored_faceoff_mm, format="%.3f", key="setup_faceoff_mm")
-            faceoff = faceoff_mm / 25.4
-        else:
-            cutoff = st.number_input("Cutoff Width (in)", min_value=0.010, step=0.001, value=stored_cutoff, format="%.3f", key="setup_cutoff")
-            faceoff = st.number_input("Faceoff Amount (in)", min_value=0.000, step=0.001, value=stored_faceoff, format="%.3f", key="setup_faceoff")
-        
-        # Smart collet suggestion with proper state handling
-        suggested_collet = suggest_collet(dia * 25.4 if units == "mm" else dia, bar_shape, units)
-        
-        # Initialize session state for collet suggestions
-        if "collet_suggestion" not in st.session_state:
-            st.session_state.collet_suggestion = suggested_collet
-        if "feed_finger_suggestion" not in st.session_state:
-            st.session_state.feed_finger_suggestion = suggested_collet
-        if "burr_collect_suggestion" not in st.session_state:
-            st.session_state.burr_collect_suggestion = suggest_burr_collet(dia * 25.4 if units == "mm" else dia, bar_shape, units)
-        
+        cutoff = unit_number_input("Cutoff Width", units, stored_cutoff, step=0.001, format="%.3f", key="setup_cutoff",
+                                   min_value=0.010)
+        faceoff = unit_number_input("Faceoff Amount", units, stored_faceoff, step=0.001, format="%.3f", key="setup_faceoff",
+                                    min_value=0.000)
+        
+        # Smart collet suggestion with proper state handling (diameter in the selected units,
+        # converted once for both the collet and burr collet lookups)
+        dia_in_units = dia * 25.4 if units == "mm" else dia
+        # Computed once per rerun; they seed empty inputs and feed the Suggest buttons below
+        suggested_collet = suggest_collet(dia_in_units, bar_shape, units)
+        suggested_burr_collet = suggest_burr_collet(dia_in_units, bar_shape, units)
+        
+        # The text inputs are seeded through session state so the Suggest buttons can
+        # overwrite them from their callbacks, without an extra st.rerun()
         collet_col1, collet_col2 = st.columns([2, 1])
         with collet_col1:
-            # Use the suggestion if the suggest button was pressed, otherwise use stored value
-            if st.session_state.get("collet_suggest_pressed", False):
-                collet_value = suggested_collet
-                st.session_state["collet_suggest_pressed"] = False  # Reset the flag
-            else:
-                collet_value = setup_data_stored.get("collets", st.session_state.collet_suggestion)
-            collets = st.text_input("Collets", value=collet_value, key="setup_collets")
+            if "setup_collets" not in st.session_state:
+                st.session_state["setup_collets"] = setup_data_stored.get("collets", suggested_collet)
+            collets = st.text_input("Collets", key="setup_collets")
         with collet_col2:
-            if st.button("💡 Suggest", key="suggest_collet", help="Auto-suggest collet based on diameter and shape"):
-                st.session_state["collet_suggest_pressed"] = True
-                st.rerun()
+            st.button("💡 Suggest", key="suggest_collet", help="Auto-suggest collet based on diameter and shape",
+                      on_click=set_widget_value, args=("setup_collets", suggested_collet))
         
         # Enhanced feed finger with suggestion
         feed_finger_col1, feed_finger_col2 = st.columns([2, 1])
         with feed_finger_col1:
-            # Use the suggestion if the suggest button was pressed, otherwise use stored value
-            if st.session_state.get("feed_finger_suggest_pressed", False):
-                feed_finger_value = suggested_collet
-                st.session_state["feed_finger_suggest_pressed"] = False  # Reset the flag
-            else:
-                feed_finger_value = setup_data_stored.get("feed_finger", st.session_state.feed_finger_suggestion)
-            feed_finger = st.text_input("Feed Finger", value=feed_finger_value, key="setup_feed_finger")
+            if "setup_feed_finger" not in st.session_state:
+                st.session_state["setup_feed_finger"] = setup_data_stored.get("feed_finger", suggested_collet)
+            feed_finger = st.text_input("Feed Finger", key="setup_feed_finger")
         with feed_finger_col2:
-            if st.button("💡 Suggest", key="suggest_feed_finger", help="Auto-suggest feed finger based on diameter and shape"):
-                st.session_state["feed_finger_suggest_pressed"] = True
-                st.rerun()
+            st.button("💡 Suggest", key="suggest_feed_finger", help="Auto-suggest feed finger based on diameter and shape",
+                      on_click=set_widget_value, args=("setup_feed_finger", suggested_collet))
         
-        stored_set_pads = setup_data_stored.get("set_pads", "")
+        stored_set_pads = setup_data_stored["set_pads"]
         set_pads = st.text_input("Set Pads", value=stored_set_pads, key="setup_set_pads")
         
         # Enhanced burr collect with suggestion
         burr_col1, burr_col2 = st.columns([2, 1])
         with burr_col1:
-            # Use the suggestion if the suggest button was pressed, otherwise use stored value
-            if st.session_state.get("burr_collect_suggest_pressed", False):
-                burr_suggestion = suggest_burr_collet(dia * 25.4 if units == "mm" else dia, bar_shape, units)
-                burr_collect_value = burr_suggestion
-                st.session_state["burr_collect_suggest_pressed"] = False  # Reset the flag
-            else:
-                burr_collect_value = setup_data_stored.get("burr_collect", st.session_state.burr_collect_suggestion)
-            burr_collect = st.text_input("Burr Collect", value=burr_collect_value, key="setup_burr_collect")
+            if "setup_burr_collect" not in st.session_state:
+                st.session_state["setup_burr_collect"] = setup_data_stored.get("burr_collect", suggested_burr_collet)
+            burr_collect = st.text_input("Burr Collect", key="setup_burr_collect")
         with burr_col2:
-            if st.button("💡 Suggest", key="suggest_burr_collect", help="Auto-suggest burr collet (typically 1-2 sizes larger)"):
-                st.session_state["burr_collect_suggest_pressed"] = True
-                st.rerun()
+            st.button("💡 Suggest", key="suggest_burr_collect", help="Auto-suggest burr collet (typically 1-2 sizes larger)",
+                      on_click=set_widget_value, args=("setup_burr_collect", suggested_burr_collet))
     with col2:
-        # Get material-specific SFM - always use material default unless user has explicitly set different value
-        material_sfm = material_data.get(material, {}).get("sfm", 300)  # Use 300 as reasonable fallback
-        
+        # Material-specific SFM - always use material default unless user has explicitly set different value
         # Use material's SFM as default (this will update when material changes)
         sfm = st.number_input("Surface Feet per Minute (SFM)", value=material_sfm, step=5, key="setup_sfm")
         st.caption(f"💡 Material Default: {material_sfm} SFM for {material}")
         if dia > 0:
-            rpm_calc = (sfm * 12) / (math.pi * dia)  # Correct SFM to RPM formula
+            rpm_calc = sfm * SFM_TO_RPM / dia  # Correct SFM to RPM formula
             st.markdown(f"**Calculated Machine RPM:** {rpm_calc:.0f}")
             max_rpm = machine_config['max_rpm']
             if rpm_calc > max_rpm:
@@ -1050,8 +1200,8 @@ def job_setup_section(material_data, sfm_guidelines):
         
         # Check if calculation inputs changed - if so, use calculated value
         stored_sfm = setup_data_stored.get("sfm", material_sfm)
-        stored_dia = setup_data_stored.get("dia", 0.3125)
-        stored_material = setup_data_stored.get("material", list(material_data.keys())[0])
+        stored_dia = setup_data_stored["dia"]
+        stored_material = setup_data_stored.get("material", materials_list[0])
         
         # If SFM, diameter, or material changed, use calculated RPM
         if (sfm != stored_sfm or dia != stored_dia or material != stored_material):
@@ -1072,36 +1222,31 @@ def job_setup_section(material_data, sfm_guidelines):
             st.caption(f"✅ Using calculated RPM: {rpm} RPM")
         
         # Enhanced bar length with unit conversion
-        stored_bar_len = setup_data_stored.get("bar_len", 144.0)
-        stored_remnant = setup_data_stored.get("remnant", 6.0)
+        stored_bar_len = setup_data_stored["bar_len"]
+        stored_remnant = setup_data_stored["remnant"]
         # Ensure stored values are reasonable (bar_len should be > 0, remnant >= 0)
         stored_bar_len = max(stored_bar_len, 1.0) if stored_bar_len > 0 else 144.0
         stored_remnant = max(stored_remnant, 0.0)
+        if units == "mm" and not stored_remnant:
+            stored_remnant = 152.4 / 25.4  # The mm inputs have always defaulted an empty remnant to 152.4 mm
+        bar_len = unit_number_input("Bar Length", units, stored_bar_len, step=1.0, format="%.3f", key="setup_bar_len",
+                                    mm_step=25.4, mm_format="%.1f")
         if units == "mm":
-            stored_bar_len_mm = stored_bar_len * 25.4 if stored_bar_len else 3657.6
-            stored_remnant_mm = stored_remnant * 25.4 if stored_remnant else 152.4
-            stored_bar_len_mm = max(stored_bar_len_mm, 25.4)
-            stored_remnant_mm = max(stored_remnant_mm, 0.0)
-            bar_len_mm = st.number_input("Bar Length (mm)", value=stored_bar_len_mm, step=25.4, format="%.1f", key="setup_bar_len_mm")
-            bar_len = bar_len_mm / 25.4
             st.caption(f"💡 Bar length in inches: {bar_len:.3f}\"")
-            remnant_mm = st.number_input("Remnant Length (mm)", min_value=0.0, max_value=bar_len_mm, value=min(stored_remnant_mm, bar_len_mm), step=12.7, format="%.1f", key="setup_remnant_mm")
-            remnant = remnant_mm / 25.4
-        else:
-            bar_len = st.number_input("Bar Length (in)", value=stored_bar_len, step=1.0, format="%.3f", key="setup_bar_len")
-            remnant = st.number_input("Remnant Length (in)", min_value=0.0, max_value=bar_len, value=min(stored_remnant, bar_len), step=0.500, format="%.3f", key="setup_remnant")
+        remnant = unit_number_input("Remnant Length", units, min(stored_remnant, bar_len), step=0.500, format="%.3f", key="setup_remnant",
+                                    min_value=0.0, max_value=bar_len, mm_step=12.7, mm_format="%.1f")
         
-        stored_spindle_gears = setup_data_stored.get("spindle_gears", "44-20")
-        stored_feed_gears = setup_data_stored.get("feed_gears", "50-30-60")
+        stored_spindle_gears = setup_data_stored["spindle_gears"]
+        stored_feed_gears = setup_data_stored["feed_gears"]
         spindle_gears = st.text_input("Spindle Gears", value=stored_spindle_gears, key="setup_spindle_gears")
         feed_gears = st.text_input("Feed Gears", value=stored_feed_gears, key="setup_feed_gears")
-        thread_gears_val = st.session_state.get("recommended_threading_gears", setup_data_stored.get("thread_gears", ""))
+        thread_gears_val = st.session_state.get("recommended_threading_gears", setup_data_stored["thread_gears"])
         thread_gears = st.text_input("Threading Gears", value=thread_gears_val, key="setup_thread_gears")
         
         # Enhanced cycle time with CPM validation
         cycle_col1, cycle_col2 = st.columns([1, 1])
         with cycle_col1:
-            stored_cycle_time = setup_data_stored.get("cycle_time", 1.6)
+            stored_cycle_time = setup_data_stored["cycle_time"]
             # Ensure stored cycle time meets minimum requirement
             stored_cycle_time = max(stored_cycle_time, 0.1) if stored_cycle_time > 0 else 1.6
             cycle_time = st.number_input("Cycle Time (sec)", min_value=0.1, value=stored_cycle_time, step=0.1, format="%.2f", key="setup_cycle_time")
@@ -1115,26 +1260,47 @@ def job_setup_section(material_data, sfm_guidelines):
                     st.warning(f"⚠️ {cpm:.1f} CPM (Non-standard)")
                 st.caption(f"Standard: {', '.join(map(str, validation['standard_cpms']))}")
             
-        stored_machine_code = setup_data_stored.get("machine_code", "A,B,O")
+        stored_machine_code = setup_data_stored["machine_code"]
         machine_code = st.text_input("Machine Code", value=stored_machine_code, key="setup_machine_code")
     
-    # Enhanced summary with units display
-    usable_bar_len = bar_len - remnant
-    per_part_len = part_length + cutoff + faceoff
-    parts_per_bar = usable_bar_len / per_part_len if per_part_len > 0 else 0
-    bar_weight = usable_bar_len * material_data.get(material, {}).get("density", 0.307)
+    # Enhanced summary with units display (recomputed only when the bar, part or material inputs change)
+    summary_key = (bar_len, remnant, part_length, cutoff, faceoff, material_density)
+    summary_cache = st.session_state.get("_summary_cache")
+    if summary_cache is not None and summary_cache[0] == summary_key:
+        usable_bar_len, per_part_len, parts_per_bar, bar_weight = summary_cache[1]
+    else:
+        usable_bar_len = bar_len - remnant
+        per_part_len = part_length + cutoff + faceoff
+        parts_per_bar = usable_bar_len / per_part_len if per_part_len > 0 else 0
+        bar_weight = usable_bar_len * material_density
+        st.session_state["_summary_cache"] = (summary_key, (usable_bar_len, per_part_len, parts_per_bar, bar_weight))
     
+    # One caption element for the whole summary (markdown hard line breaks between the lines)
     if units == "mm":
-        st.caption(f"Usable Bar Length: **{usable_bar_len:.3f} in** ({usable_bar_len * 25.4:.1f} mm)")
-        st.caption(f"Per Part Length: **{per_part_len:.3f} in** ({per_part_len * 25.4:.1f} mm)")
+        usable_mm = f" ({usable_bar_len * 25.4:.1f} mm)"
+        per_part_mm = f" ({per_part_len * 25.4:.1f} mm)"
     else:
-        st.caption(f"Usable Bar Length: **{usable_bar_len:.3f} in**")
-        st.caption(f"Per Part Length: **{per_part_len:.3f} in**")
-    
-    st.caption(f"Estimated Parts per Bar: **{parts_per_bar:.2f}**")
-    st.caption(f"Usable Bar Weight: **{bar_weight:.2f} lbs**")
+        usable_mm = per_part_mm = ""
+    st.caption(
+        f"Usable Bar Length: **{usable_bar_len:.3f} in**{usable_mm}  \n"
+        f"Per Part Length: **{per_part_len:.3f} in**{per_part_mm}  \n"
+        f"Estimated Parts per Bar: **{parts_per_bar:.2f}**  \n"
+        f"Usable Bar Weight: **{bar_weight:.2f} lbs**"
+    )
     
-    # Store all key data in session state for cross-tab persistence
+    # Store all key data in session state for cross-tab persistence; skip the rebuild
+    # when no input changed (the CAM tab writes cycle_time back into setup_data, so check it too)
+    setup_fingerprint = (
+        job_name, material, bar_shape, dia, part_length, cutoff, faceoff, collets, feed_finger,
+        set_pads, burr_collect, sfm, rpm, bar_len, remnant, spindle_gears, feed_gears, thread_gears,
+        cycle_time, machine_code, machine_type, machine_capacity, units
+    )
+    stored_setup_data = st.session_state.get("setup_data")
+    if (stored_setup_data is not None
+            and st.session_state.get("_setup_fp") == setup_fingerprint
+            and stored_setup_data.get("cycle_time") == cycle_time):
+        return stored_setup_data
+    st.session_state["_setup_fp"] = setup_fingerprint
     st.session_state["cycle_time_from_tab1"] = cycle_time
     st.session_state["setup_data"] = {
         "job_name": job_name, "material": material, "bar_shape": bar_shape, "dia": dia, 
@@ -1200,8 +1366,7 @@ def quote_breakdown_section(parts_per_bar, bar_weight, cycle_time=1.6):
             st.metric("Calculated CPM", f"{calculated_cpm:.1f}")
             
             # Check against standard CPM rates [75, 60, 45]
-            standard_cpms = [75, 60, 45]
-            closest_cpm = min(standard_cpms, key=lambda x: abs(x - calculated_cpm))
+            closest_cpm = closest_standard_cpm(calculated_cpm)
             cpm_diff = abs(closest_cpm - calculated_cpm)
             
             if cpm_diff < 2:  # Within 2 CPM tolerance
@@ -1212,32 +1377,39 @@ def quote_breakdown_section(parts_per_bar, bar_weight, cycle_time=1.6):
             st.error("Invalid cycle time")
     
     with cycle_col3:
+        reference_caption = "📊 Standard CPMs: 75, 60, 45  \n🔧 Formula: CPM = 60 ÷ cycle_time"
         if tab2_cycle_time != cycle_time:
             st.success(f"✅ From CAM Operations: {tab2_cycle_time:.2f} sec")
+            st.caption(reference_caption)
         else:
-            st.caption(f"💡 Default: {cycle_time_input:.2f} sec")
-        st.caption("📊 Standard CPMs: 75, 60, 45")
-        st.caption("🔧 Formula: CPM = 60 ÷ cycle_time")
-    
-    def calc_with_production(qty, price_per_lb, cycle_time_sec):
-        bars = int((qty / parts_per_bar) + 0.999) if parts_per_bar else 0
-        weight = round(qty * (bar_weight / parts_per_bar), 2) if parts_per_bar else 0
-        cost = round(weight * price_per_lb, 2) if price_per_lb else 0.0
+            st.caption(f"💡 Default: {cycle_time_input:.2f} sec  \n{reference_caption}")
+    
+    def calc_with_production(qtys, prices_per_lb, cycle_time_sec):
+        qtys = np.asarray(qtys, dtype=np.float64)
+        prices_per_lb = np.asarray(prices_per_lb, dtype=np.float64)
+        if parts_per_bar:
+            bars = np.ceil(qtys / parts_per_bar).astype(np.int64)
+            raw_weight = qtys * (bar_weight / parts_per_bar)
+        else:
+            bars = np.zeros(qtys.shape, dtype=np.int64)
+            raw_weight = np.zeros(qtys.shape)
+        # Python round() keeps the cents identical to the per-quote calculation (np.round splits half-cent ties differently)
+        weight = np.array([round(w, 2) for w in raw_weight.tolist()])
+        cost = np.array([round(w * p, 2) if p else 0.0 for w, p in zip(weight.tolist(), prices_per_lb.tolist())])
         
         # Enhanced production time calculations
         # Basic production time (cycle time × quantity)
-        basic_production_seconds = qty * cycle_time_sec
+        basic_production_seconds = qtys * cycle_time_sec
         
         # Add setup time per bar change (typically 30-60 seconds per bar)
         setup_time_per_bar = 45  # seconds
         total_setup_time = bars * setup_time_per_bar
         
         # Add daily startup/warmup time (typically 15-30 minutes per 8-hour shift)
-        if basic_production_seconds > 0:
-            estimated_shifts = (basic_production_seconds + total_setup_time) / (8 * 3600)  # 8-hour shifts
-            startup_time = max(1, estimated_shifts) * 20 * 60  # 20 minutes per shift
-        else:
-            startup_time = 0
+        estimated_shifts = (basic_production_seconds + total_setup_time) / (8 * 3600)  # 8-hour shifts
+        startup_time = np.where(basic_production_seconds > 0,
+                                np.maximum(1, estimated_shifts) * 20 * 60,  # 20 minutes per shift
+                                0.0)
         
         # Total time including setup and startup
         total_seconds_with_overhead = basic_production_seconds + total_setup_time + startup_time
@@ -1247,40 +1419,38 @@ def quote_breakdown_section(parts_per_bar, bar_weight, cycle_time=1.6):
         total_hours_85 = total_hours_100 / 0.85  # 85% efficiency (good operator)
         total_hours_70 = total_hours_100 / 0.70  # 70% efficiency (realistic with breaks/issues)
         
-        return bars, weight, cost, total_hours_100, total_hours_85, total_hours_70
+        # Back to Python scalars, one row per quote tier, for display
+        return list(zip(bars.tolist(), weight.tolist(), cost.tolist(),
+                        total_hours_100.tolist(), total_hours_85.tolist(), total_hours_70.tolist()))
+    
+    # All three quote tiers in one pass
+    quote_tiers = [("Low Quote", low), ("Mid Quote", mid), ("High Quote", high)]
+    quote_results = calc_with_production([low, mid, high], [price_low, price_mid, price_high], cycle_time_input)
     
     # Display results
     c1, c2, c3 = st.columns(3)
-    for col, (label, qty, price, color) in zip(
-        [c1, c2, c3],
-        [("Low Quote", low, price_low, "#cce5ff"),
-         ("Mid Quote", mid, price_mid, "#fff3cd"),
-         ("High Quote", high, price_high, "#d4edda")]
+    for col, (label, qty), (bars, weight, cost, hours_100, hours_85, hours_70) in zip(
+        [c1, c2, c3], quote_tiers, quote_results
     ):
-        bars, weight, cost, hours_100, hours_85, hours_70 = calc_with_production(qty, price, cycle_time_input)
         with col:
-            st.markdown(f"""
-                <div style='background-color:{color}; padding:12px; border-radius:10px; margin-bottom:10px'>
-                <strong>{label}</strong><br>
-                Quantity: {qty:,}<br>
-                Bars: {bars}<br>
-                Weight: {weight:.2f} lbs<br>
-                Est. Mat.Cost: ${cost:.2f}<br>
-                Mat.Cost/Part: ${cost/qty:.4f}
-                </div>
-            """, unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown(f"**{label}**")
+                st.metric("Quantity", f"{qty:,}")
+                st.metric("Bars", bars)
+                st.metric("Weight", f"{weight:.2f} lbs")
+                st.metric("Est. Mat.Cost", f"${cost:.2f}")
+                st.metric("Mat.Cost/Part", f"${cost/qty:.4f}")
             
             # Enhanced production hours with multiple efficiency levels
-            st.markdown(f"""
-                <div style='background-color:#f8f9fa; padding:10px; border-radius:8px; border-left:4px solid #28a745'>
-                <strong>📅 Production Hours</strong><br>
-                <small>(Includes setup & startup time)</small><br>
-                100% Theoretical: <strong>{hours_100:.1f} hrs</strong><br>
-                85% Efficiency: <strong>{hours_85:.1f} hrs</strong><br>
-                70% Efficiency: <strong>{hours_70:.1f} hrs</strong><br>
-                Days @ 8hrs (70%): <strong>{hours_70/8:.1f} days</strong>
-                </div>
-            """, unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("**📅 Production Hours**")
+                st.caption("(Includes setup & startup time)")
+                st.markdown(
+                    f"100% Theoretical: **{hours_100:.1f} hrs**  \n"
+                    f"85% Efficiency: **{hours_85:.1f} hrs**  \n"
+                    f"70% Efficiency: **{hours_70:.1f} hrs**  \n"
+                    f"Days @ 8hrs (70%): **{hours_70/8:.1f} days**"
+                )
     
     # CPM Reference Table
     st.markdown("#### 📊 CPM Reference (Cycles Per Minute)")
@@ -1313,6 +1483,61 @@ def quote_breakdown_section(parts_per_bar, bar_weight, cycle_time=1.6):
     # Return quote data for cross-tab access
     return st.session_state["quote_data"]
         
+# Threading calculator methods: threading RPM as a ratio of work RPM, the cam spaces
+# (hundredths of the 50-space working cycle) each method uses, and the suffix of the
+# per-method keys sent to CAM Operations
+THREADING_CALC_METHODS = MappingProxyType({
+    # Manual: 32 driver/32 driven × 21 driver/28 driven = 0.75 ratio; 6:1 uses 0 to 32.5 hundredths
+    "6:1 Threading (Steel)": MappingProxyType({"short": "6:1", "result_suffix": "6to1", "rpm_ratio": (32/32) * (21/28), "cam_spaces": 32.5, "cam_percentage": 32.5 / 50.0}),
+    # Manual: 36 driver/27 driven = 1.33 ratio; 2:1 uses 0 to 25 hundredths
+    "2:1 Threading (Brass)": MappingProxyType({"short": "2:1", "result_suffix": "2to1", "rpm_ratio": 36/27, "cam_spaces": 25.0, "cam_percentage": 25.0 / 50.0}),
+    # Manual: Half speed method; 4:1 uses brass cam (0 to 25 hundredths)
+    "4:1 Threading (Hybrid)": MappingProxyType({"short": "4:1", "result_suffix": "4to1", "rpm_ratio": 0.5, "cam_spaces": 25.0, "cam_percentage": 25.0 / 50.0}),
+})
+THREADING_CALC_METHOD_OPTIONS = tuple(THREADING_CALC_METHODS)
+
+# Manual threading example: 1810 RPM, 0.375" thread, 24 TPI, 2.4 sec cycle, 6:1 (32.5/50 = 65%)
+# 1810 → 453 differential → 7.54 rev/sec → 18.1 total → 11.765 effective → 0.490 rise
+MANUAL_THREADING_EXAMPLE = MappingProxyType({
+    "rpm": 1810, "thread_len": 0.375, "tpi": 24.0,
+    "diff": 453.0, "rev_sec": 7.54, "total": 18.1, "eff": 11.765, "rise": 0.490,
+})
+
+# Machine rate options and the index time (seconds) of each
+THREADING_INDEX_TIMES = MappingProxyType({"75 CPM (.4)": 0.4, "60 CPM (.5)": 0.5, "45 CPM (.66)": 0.66})
+THREADING_CYCLE_RATE_OPTIONS = tuple(THREADING_INDEX_TIMES)
+
+class ThreadSpecs(NamedTuple):
+    """Thread calculator specifications shared by its columns and the gear section"""
+    cam_rpm: float = 600
+    cam_thread_length: float = 0.375
+    cam_pitch: float = 24.0
+    cam_cycle_time: float = 2.4
+    cam_cycle_rate: str = "75 CPM (.4)"
+
+def write_lines(*lines):
+    """Several st.write-style markdown lines rendered as one element"""
+    st.markdown("\n\n".join(lines))
+
+def show_block_setting(rise_needed, actual_cam_rise, block_setting):
+    """Block setting calculation with a single status message for its range check"""
+    st.markdown("##### 📐 Block Setting Calculation")
+    write_lines(f"Rise Needed: {rise_needed:.4f}\"", f"Actual Cam Rise: {actual_cam_rise:.4f}\"")
+    st.info(f"**Block Setting: {block_setting:.3f}**")
+    
+    # Block setting validation
+    if 0.8 <= block_setting <= 1.2:
+        st.success("✅ Block setting within optimal range (0.8 - 1.2)")
+    elif block_setting < 0.8:
+        st.warning("⚠️ Block setting low - consider smaller cam")
+    else:
+        st.warning("⚠️ Block setting high - consider larger cam")
+
+# Fragments (Streamlit 1.37+) rerun only the thread calculator when its widgets change;
+# older releases simply run it as part of the whole script
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+@_fragment
 def thread_calculator_section(setup_rpm=600):
     st.header("🧮 Threading Calculator")
     
@@ -1342,20 +1567,22 @@ def thread_calculator_section(setup_rpm=600):
     
     with specs_col1:
         st.markdown("#### Input Parameters")
-        tpi = st.number_input("Threads per Inch (TPI)", value=24.0, step=0.1, format="%.1f", key="thread_calc_tpi")
-        thread_len = st.number_input("Thread Length (in)", value=0.375, step=0.001, format="%.3f", key="thread_calc_length")
-        cycle_time = st.number_input("Cycle Time (sec)", value=cycle_time_from_tab2, step=0.1, format="%.2f", key="thread_calc_cycle")
-        
-        cycle_rate_options = ["75 CPM (.4)", "60 CPM (.5)", "45 CPM (.66)"]
-        cycle_rate = st.selectbox("Machine Rate", cycle_rate_options, key="thread_calc_rate")
-        
-        work_rpm = st.number_input("Work RPM", value=current_setup_rpm, step=100, key="thread_calc_rpm")
+        # Inputs are batched in a form: the calculations below rerun on Recalculate (or Enter),
+        # not on every keystroke
+        with st.form("thread_calc_form"):
+            tpi = st.number_input("Threads per Inch (TPI)", value=24.0, step=0.1, format="%.1f", key="thread_calc_tpi")
+            thread_len = st.number_input("Thread Length (in)", value=0.375, step=0.001, format="%.3f", key="thread_calc_length")
+            cycle_time = st.number_input("Cycle Time (sec)", value=cycle_time_from_tab2, step=0.1, format="%.2f", key="thread_calc_cycle")
+            
+            cycle_rate = st.selectbox("Machine Rate", THREADING_CYCLE_RATE_OPTIONS, key="thread_calc_rate")
+            
+            work_rpm = st.number_input("Work RPM", value=current_setup_rpm, step=100, key="thread_calc_rpm")
+            st.form_submit_button("🔄 Recalculate")
         if work_rpm == current_setup_rpm:
             st.caption("✅ From Job Setup")
             
         # Extract index time from the selected option and calculate working time dynamically
-        index_map = {"75 CPM (.4)": 0.4, "60 CPM (.5)": 0.5, "45 CPM (.66)": 0.66}
-        index_time = index_map[cycle_rate]
+        index_time = THREADING_INDEX_TIMES[cycle_rate]
         working_time = cycle_time - index_time
         
         st.markdown(f"**Working Time:** {working_time:.2f} sec")
@@ -1373,13 +1600,8 @@ def thread_calculator_section(setup_rpm=600):
         pass
 
     # Store specifications in session state for persistence
-    st.session_state["thread_cam_data"] = {
-        "cam_rpm": work_rpm,
-        "cam_thread_length": thread_len,
-        "cam_pitch": tpi,
-        "cam_cycle_time": cycle_time,
-        "cam_cycle_rate": cycle_rate
-    }
+    specs = ThreadSpecs(work_rpm, thread_len, tpi, cycle_time, cycle_rate)
+    st.session_state["thread_cam_data"] = specs
 
     # 3-column layout for calculations
     col1, col2, col3 = st.columns(3)
@@ -1388,50 +1610,35 @@ def thread_calculator_section(setup_rpm=600):
         st.markdown("#### 1️⃣ Calculate Rise Needed")
         st.caption("📐 Determine required cam rise based on threading method")
         
-        method_options = [
-            "6:1 Threading (Steel)",
-            "2:1 Threading (Brass)", 
-            "4:1 Threading (Hybrid)"
-        ]
-        method = st.selectbox("Threading Method", method_options, key="thread_calc_method")
+        method = st.selectbox("Threading Method", THREADING_CALC_METHOD_OPTIONS, key="thread_calc_method")
         
         # Calculate threading RPM based on method (using corrected formulas)
-        if "6:1" in method:
-            # Manual: 32 driver/32 driven × 21 driver/28 driven = 0.75 ratio
-            threading_rpm = work_rpm * (32/32) * (21/28)  # 0.75 × work RPM
-            cam_spaces = 32.5  # 6:1 uses 0 to 32.5 hundredths
-            method_short = "6:1"
-        elif "2:1" in method:
-            # Manual: 36 driver/27 driven = 1.33 ratio
-            threading_rpm = work_rpm * (36/27)  # 1.333 × work RPM per manual
-            cam_spaces = 25.0  # 2:1 uses 0 to 25 hundredths  
-            method_short = "2:1"
-        elif "4:1" in method:
-            # Manual: Half speed method
-            threading_rpm = work_rpm / 2  # Half speed
-            cam_spaces = 25.0  # 4:1 uses brass cam (0 to 25 hundredths)
-            method_short = "4:1"
+        method_info = THREADING_CALC_METHODS[method]
+        threading_rpm = work_rpm * method_info["rpm_ratio"]
+        cam_spaces = method_info["cam_spaces"]
+        method_short = method_info["short"]
         
         # Calculate differential RPM (manual methodology)
         differential_rpm = abs(work_rpm - threading_rpm)
         
-        st.markdown(f"##### 🔧 {method_short} Threading Calculations")
-        st.write(f"Threading RPM: {threading_rpm:.0f}")
-        st.write(f"Differential RPM: {differential_rpm:.0f}")
-        st.write(f"Rev/Second: {differential_rpm/60:.2f}")
-        
         # Calculate effective revolutions (manual formula)
         # Manual: Rev/sec × working_time × cam_percentage
         revolutions_per_second = differential_rpm / 60
         total_revolutions_working_time = revolutions_per_second * working_time
         
         # Apply cam space percentage
-        cam_percentage = cam_spaces / 50.0  # Convert to percentage of full cycle
+        cam_percentage = method_info["cam_percentage"]  # Cam spaces as a share of the full cycle
         effective_revolutions = total_revolutions_working_time * cam_percentage
         
-        st.write(f"Total Revs (working time): {total_revolutions_working_time:.2f}")
-        st.write(f"Cam Spaces Used: {cam_spaces} of 50 ({cam_percentage*100:.1f}%)")
-        st.write(f"Effective Revolutions: {effective_revolutions:.3f}")
+        st.markdown(f"##### 🔧 {method_short} Threading Calculations")
+        write_lines(
+            f"Threading RPM: {threading_rpm:.0f}",
+            f"Differential RPM: {differential_rpm:.0f}",
+            f"Rev/Second: {revolutions_per_second:.2f}",
+            f"Total Revs (working time): {total_revolutions_working_time:.2f}",
+            f"Cam Spaces Used: {cam_spaces} of 50 ({cam_percentage*100:.1f}%)",
+            f"Effective Revolutions: {effective_revolutions:.3f}"
+        )
         
         # Calculate rise needed (manual formula)
         rise_needed = effective_revolutions / tpi
@@ -1439,78 +1646,57 @@ def thread_calculator_section(setup_rpm=600):
         st.info(f"**🎯 Rise Needed: {rise_needed:.4f}\"**")
         
         # Manual validation example
-        if abs(work_rpm - 1810) < 10 and abs(thread_len - 0.375) < 0.001 and abs(tpi - 24.0) < 0.1:
+        example = MANUAL_THREADING_EXAMPLE
+        if abs(work_rpm - example["rpm"]) < 10 and abs(thread_len - example["thread_len"]) < 0.001 and abs(tpi - example["tpi"]) < 0.1:
             st.markdown("##### ✅ Manual Example Validation")
-            # Manual: 1810 → 453 differential → 7.54 rev/sec → 18.1 total → 11.765 effective → 0.490 rise
-            manual_differential = 1810 - (1810 * 0.75)  # 453 RPM
-            manual_rev_sec = manual_differential / 60  # 7.54
-            manual_total = manual_rev_sec * 2.4  # 18.1 (using 2.4 sec)
-            manual_effective = manual_total * 0.65  # 11.765 (65% for 32.5/50)
-            manual_rise = manual_effective / 24  # 0.490
-            
-            st.caption(f"📖 **Manual Example (1810 RPM, 0.375\", 24 TPI):**")
-            st.caption(f"• Expected: 453 diff → 7.54 rev/sec → 18.1 total → 11.765 eff → 0.490 rise")
-            st.caption(f"• Calculated: {differential_rpm:.0f} diff → {revolutions_per_second:.2f} rev/sec → {total_revolutions_working_time:.1f} total → {effective_revolutions:.3f} eff → {rise_needed:.3f} rise")
+            st.caption(
+                f"📖 **Manual Example (1810 RPM, 0.375\", 24 TPI):**  \n"
+                f"• Expected: {example['diff']:.0f} diff → {example['rev_sec']:.2f} rev/sec → {example['total']:.1f} total → {example['eff']:.3f} eff → {example['rise']:.3f} rise  \n"
+                f"• Calculated: {differential_rpm:.0f} diff → {revolutions_per_second:.2f} rev/sec → {total_revolutions_working_time:.1f} total → {effective_revolutions:.3f} eff → {rise_needed:.3f} rise"
+            )
             
-            if abs(rise_needed - 0.490) < 0.020:
+            if abs(rise_needed - example["rise"]) < 0.020:
                 st.success("✅ **Matches manual example within tolerance!**")
             else:
-                st.warning(f"⚠️ **Difference from manual: {abs(rise_needed - 0.490):.3f}\"**")
+                st.warning(f"⚠️ **Difference from manual: {abs(rise_needed - example['rise']):.3f}\"**")
         
         # Cam selection using JSON database
-        cam_suggestion = suggest_davenport_cam(rise_needed)
+        # Calculated values for the cam and time columns; the cam lookup and block setting
+        # are only redone when one of the calculator inputs changed
+        inputs_key = (tpi, thread_len, cycle_time, cycle_rate, work_rpm, method)
+        rise_data = st.session_state.get("thread_rise_data")
+        if not rise_data or st.session_state.get("_thread_inputs_key") != inputs_key:
+            cam = suggest_davenport_cam(rise_needed)
+            rise_data = {
+                "rise_needed": rise_needed,
+                "cam_suggestion": f"{cam['name']} ({cam['size']}, Rise: {cam['rise']:.4f}\")",
+                "effective_revolutions": effective_revolutions,
+                "threading_rpm": threading_rpm,
+                "differential_rpm": differential_rpm,
+                "method": method
+            }
+            # Block setting from the suggested cam's rise
+            if cam["rise"] > 0:
+                rise_data["actual_cam_rise"] = cam["rise"]
+                rise_data["block_setting"] = rise_needed / cam["rise"]
+            st.session_state["thread_rise_data"] = rise_data
+            st.session_state["_thread_inputs_key"] = inputs_key
+        
+        cam_suggestion = rise_data["cam_suggestion"]
         st.success(f"🔧 **Recommended Cam:** {cam_suggestion}")
         
-        # Extract cam rise for block setting calculation
-        if "Rise:" in cam_suggestion:
-            try:
-                cam_rise_text = cam_suggestion.split("Rise: ")[1].split(")")[0]
-                actual_cam_rise = float(cam_rise_text)
-                block_setting = rise_needed / actual_cam_rise
-                
-                st.markdown("##### 📐 Block Setting Calculation")
-                st.write(f"Rise Needed: {rise_needed:.4f}\"")
-                st.write(f"Actual Cam Rise: {actual_cam_rise:.4f}\"")
-                st.info(f"**Block Setting: {block_setting:.3f}**")
-                
-                # Block setting validation
-                if 0.8 <= block_setting <= 1.2:
-                    st.success("✅ Block setting within optimal range (0.8 - 1.2)")
-                elif block_setting < 0.8:
-                    st.warning("⚠️ Block setting low - consider smaller cam")
-                else:
-                    st.warning("⚠️ Block setting high - consider larger cam")
-                    
-                # Manual block setting validation
-                if abs(rise_needed - 0.490) < 0.010 and abs(actual_cam_rise - 0.452) < 0.010:
-                    expected_block = 0.490 / 0.452  # 1.084
-                    st.caption(f"📖 Manual example: 0.490 ÷ 0.452 = 1.084")
-                    if abs(block_setting - expected_block) < 0.010:
-                        st.success("✅ Block setting matches manual example!")
-                
-                # Store calculated values for time calculation
-                st.session_state["thread_rise_data"] = {
-                    "rise_needed": rise_needed,
-                    "cam_suggestion": cam_suggestion,
-                    "actual_cam_rise": actual_cam_rise,
-                    "block_setting": block_setting,
-                    "effective_revolutions": effective_revolutions,
-                    "threading_rpm": threading_rpm,
-                    "differential_rpm": differential_rpm,
-                    "method": method
-                }
+        actual_cam_rise = rise_data.get("actual_cam_rise")
+        if actual_cam_rise:
+            block_setting = rise_data["block_setting"]
+            
+            show_block_setting(rise_needed, actual_cam_rise, block_setting)
                 
-            except (ValueError, IndexError):
-                st.caption("📐 Block Setting: Manual calculation needed")
-                # Store basic data even without block setting
-                st.session_state["thread_rise_data"] = {
-                    "rise_needed": rise_needed,
-                    "cam_suggestion": cam_suggestion,
-                    "effective_revolutions": effective_revolutions,
-                    "threading_rpm": threading_rpm,
-                    "differential_rpm": differential_rpm,
-                    "method": method
-                }
+            # Manual block setting validation
+            if abs(rise_needed - 0.490) < 0.010 and abs(actual_cam_rise - 0.452) < 0.010:
+                expected_block = 0.490 / 0.452  # 1.084
+                st.caption(f"📖 Manual example: 0.490 ÷ 0.452 = 1.084")
+                if abs(block_setting - expected_block) < 0.010:
+                    st.success("✅ Block setting matches manual example!")
         else:
             st.caption("📐 Block Setting: Manual calculation needed")
 
@@ -1518,128 +1704,97 @@ def thread_calculator_section(setup_rpm=600):
         st.markdown("#### 2️⃣ Calculate Cam Needed")
         st.caption("🔧 Select appropriate cam based on rise needed")
         
-        # Get calculated rise data from column 1
-        rise_data = st.session_state.get("thread_rise_data", {})
-        specs_data = st.session_state.get("thread_cam_data", {})
-        
+        # rise_data is the local worked out in column 1
         if not rise_data:
             st.info("💡 Complete rise calculations in column 1 first")
             st.markdown("##### Summary")
-            st.write("Thread Length: Enter in specifications")
-            st.write("TPI (Pitch): Enter in specifications")
-            st.write("Rise Needed: Calculate in column 1")
-            st.write("Cam Selection: Will show here")
+            write_lines(
+                "Thread Length: Enter in specifications",
+                "TPI (Pitch): Enter in specifications",
+                "Rise Needed: Calculate in column 1",
+                "Cam Selection: Will show here"
+            )
         else:
             # Extract data from calculations
             rise_needed = rise_data.get("rise_needed", 0)
-            method = rise_data.get("method", "6:1 Threading (Steel)")
             cam_suggestion = rise_data.get("cam_suggestion", "")
             
-            st.write(f"📊 **Using Calculated Data:**")
-            st.write(f"• Thread Length: {specs_data.get('cam_thread_length', 0.375):.3f}\"")
-            st.write(f"• Pitch: {specs_data.get('cam_pitch', 24.0):.1f} TPI")
-            st.write(f"• Rise Needed: {rise_needed:.4f}\"")
-            st.write(f"• Method: {method.split()[0]}")
+            write_lines(
+                f"📊 **Using Calculated Data:**",
+                f"• Thread Length: {specs.cam_thread_length:.3f}\"",
+                f"• Pitch: {specs.cam_pitch:.1f} TPI",
+                f"• Rise Needed: {rise_needed:.4f}\"",
+                f"• Method: {method_short}"
+            )
             
             # Show cam suggestion
             st.success(f"🔧 **Recommended Cam:** {cam_suggestion}")
             
-            # Extract cam details for block setting
-            if "Rise:" in cam_suggestion:
-                try:
-                    cam_rise_text = cam_suggestion.split("Rise: ")[1].split(")")[0]
-                    actual_cam_rise = float(cam_rise_text)
-                    block_setting = rise_needed / actual_cam_rise
-                    
-                    st.markdown("##### 📐 Block Setting Calculation")
-                    st.write(f"Rise Needed: {rise_needed:.4f}\"")
-                    st.write(f"Actual Cam Rise: {actual_cam_rise:.4f}\"")
-                    st.info(f"**Block Setting: {block_setting:.3f}**")
-                    
-                    # Block setting validation
-                    if 0.8 <= block_setting <= 1.2:
-                        st.success("✅ Block setting within optimal range (0.8 - 1.2)")
-                    elif block_setting < 0.8:
-                        st.warning("⚠️ Block setting low - consider smaller cam")
-                    else:
-                        st.warning("⚠️ Block setting high - consider larger cam")
-                        
-                    # Store cam data for time calculations
-                    rise_data["actual_cam_rise"] = actual_cam_rise
-                    rise_data["block_setting"] = block_setting
-                    st.session_state["thread_rise_data"] = rise_data
-                    
-                except (ValueError, IndexError):
-                    st.caption("📐 Block Setting: Manual calculation needed")
+            # Block setting worked out and validated in column 1; summarize it here
+            actual_cam_rise = rise_data.get("actual_cam_rise")
+            if actual_cam_rise:
+                st.caption(f"📐 Block Setting: {rise_data['block_setting']:.3f} (Actual Cam Rise: {actual_cam_rise:.4f}\")")
             else:
                 st.caption("📐 Block Setting: Manual calculation needed")
 
+    # Last stored time results; replaced when column 3 recalculates them
+    time_data = st.session_state.get("thread_time_data", {})
+
     with col3:
         # Convert to expandable info box
         with st.expander("⏱️ Calculate Time Required", expanded=False):
             st.caption("⏱️ Determine actual operation time needed")
             
-            # Get calculated rise data from column 2
-            rise_data = st.session_state.get("thread_rise_data", {})
-            specs_data = st.session_state.get("thread_cam_data", {})
-            
             if not rise_data:
                 st.info("💡 Complete rise calculations in column 1 first")
                 st.markdown("##### Summary")
-                st.write("Thread Length: Enter in specifications")
-                st.write("Pitch (TPI): Enter in specifications")
-                st.write("Rise Needed: Calculate in column 1")
-                st.write("Time Required: Will calculate here")
+                write_lines(
+                    "Thread Length: Enter in specifications",
+                    "Pitch (TPI): Enter in specifications",
+                    "Rise Needed: Calculate in column 1",
+                    "Time Required: Will calculate here"
+                )
             else:
                 # Extract data from calculations
                 rise_needed = rise_data.get("rise_needed", 0)
-                method = rise_data.get("method", "6:1 Threading (Steel)")
                 threading_rpm = rise_data.get("threading_rpm", 0)
                 cam_suggestion = rise_data.get("cam_suggestion", "")
                 
                 # Get specifications
-                thread_len = specs_data.get("cam_thread_length", 0.375)
-                tpi = specs_data.get("cam_pitch", 24.0)
-                cycle_time = specs_data.get("cam_cycle_time", 2.4)
-                cycle_rate = specs_data.get("cam_cycle_rate", "75 CPM (.4)")
+                thread_len = specs.cam_thread_length
+                tpi = specs.cam_pitch
+                cycle_time = specs.cam_cycle_time
+                cycle_rate = specs.cam_cycle_rate
                 
                 # Extract index time from cycle rate
-                index_map = {"75 CPM (.4)": 0.4, "60 CPM (.5)": 0.5, "45 CPM (.66)": 0.66}
-                index_time = index_map.get(cycle_rate, 0.4)
+                index_time = THREADING_INDEX_TIMES.get(cycle_rate, 0.4)
                 
-                st.write(f"📊 **Using Calculated Data:**")
-                st.write(f"• Thread Length: {thread_len:.3f}\"")
-                st.write(f"• Pitch: {tpi:.1f} TPI")
-                st.write(f"• Rise Needed: {rise_needed:.4f}\"")
-                st.write(f"• Method: {method.split()[0]}")
-                st.write(f"• Threading RPM: {threading_rpm:.0f}")
+                write_lines(
+                    f"📊 **Using Calculated Data:**",
+                    f"• Thread Length: {thread_len:.3f}\"",
+                    f"• Pitch: {tpi:.1f} TPI",
+                    f"• Rise Needed: {rise_needed:.4f}\"",
+                    f"• Method: {method_short}",
+                    f"• Threading RPM: {threading_rpm:.0f}"
+                )
                 
                 # Calculate total thread length (including lead threads)
                 total_thread_length = thread_len + (3 / tpi)  # Thread + 3 lead threads
                 total_revolutions_needed = total_thread_length * tpi
                 
                 st.markdown("##### 📏 Thread Requirements")
-                st.write(f"Thread Length: {thread_len:.3f}\"")
-                st.write(f"Lead Threads: 3 ÷ {tpi:.1f} = {3/tpi:.3f}\"")
-                st.write(f"Total Length: {total_thread_length:.3f}\"")
-                st.write(f"Total Revolutions: {total_revolutions_needed:.1f}")
+                write_lines(
+                    f"Thread Length: {thread_len:.3f}\"",
+                    f"Lead Threads: 3 ÷ {tpi:.1f} = {3/tpi:.3f}\"",
+                    f"Total Length: {total_thread_length:.3f}\"",
+                    f"Total Revolutions: {total_revolutions_needed:.1f}"
+                )
                 
                 # Calculate time required based on method
-                if "6:1" in method:
-                    # 6:1 threading uses 32.5 cam spaces (65% of cycle)
-                    cam_percentage = 32.5 / 50.0
-                    effective_threading_rpm = threading_rpm  # Use calculated threading RPM
-                elif "2:1" in method:
-                    # 2:1 threading uses 25 cam spaces (50% of cycle)
-                    cam_percentage = 25.0 / 50.0
-                    effective_threading_rpm = threading_rpm
-                elif "4:1" in method:
-                    # 4:1 threading uses 25 cam spaces (50% of cycle)
-                    cam_percentage = 25.0 / 50.0
-                    effective_threading_rpm = threading_rpm
-                else:
-                    cam_percentage = 0.5
-                    effective_threading_rpm = threading_rpm
+                # 6:1 uses 32.5 cam spaces (65% of cycle), 2:1 and 4:1 use 25 (50%)
+                method_info = THREADING_CALC_METHODS.get(method)
+                cam_percentage = method_info["cam_percentage"] if method_info else 0.5
+                effective_threading_rpm = threading_rpm  # Use calculated threading RPM
                 
                 # Time calculation using differential RPM methodology
                 if effective_threading_rpm > 0:
@@ -1654,12 +1809,14 @@ def thread_calculator_section(setup_rpm=600):
                     total_time_required = adjusted_threading_time + index_time
                     
                     st.markdown("##### ⏱️ Time Calculation")
-                    st.write(f"Threading RPM: {effective_threading_rpm:.0f}")
-                    st.write(f"Rev/Second: {revolutions_per_second:.2f}")
-                    st.write(f"Threading Time: {threading_time:.2f} sec")
-                    st.write(f"Cam Factor: {cam_percentage:.1%} ({cam_percentage*50:.1f}/50 spaces)")
-                    st.write(f"Adjusted Time: {adjusted_threading_time:.2f} sec")
-                    st.write(f"Index Time: +{index_time:.2f} sec")
+                    write_lines(
+                        f"Threading RPM: {effective_threading_rpm:.0f}",
+                        f"Rev/Second: {revolutions_per_second:.2f}",
+                        f"Threading Time: {threading_time:.2f} sec",
+                        f"Cam Factor: {cam_percentage:.1%} ({cam_percentage*50:.1f}/50 spaces)",
+                        f"Adjusted Time: {adjusted_threading_time:.2f} sec",
+                        f"Index Time: +{index_time:.2f} sec"
+                    )
                     
                     st.success(f"**⏱️ Total Time Required: {total_time_required:.2f} sec**")
                     
@@ -1673,7 +1830,7 @@ def thread_calculator_section(setup_rpm=600):
                         st.warning("🔧 Consider: Faster threading method, higher RPM, or longer cycle")
                     
                     # Store time calculation results
-                    st.session_state["thread_time_data"] = {
+                    time_data = {
                         "total_time_required": total_time_required,
                         "threading_time": threading_time,
                         "adjusted_threading_time": adjusted_threading_time,
@@ -1681,19 +1838,19 @@ def thread_calculator_section(setup_rpm=600):
                         "total_revolutions_needed": total_revolutions_needed,
                         "fits_in_cycle": total_time_required <= cycle_time
                     }
+                    st.session_state["thread_time_data"] = time_data
                     
                 else:
                     st.error("❌ Invalid threading RPM - check calculations")
             
             # Summary section
             st.markdown("##### 📋 Threading Summary")
-            if rise_data and specs_data:
-                st.write(f"**Method:** {method.split()[0]}")
+            if rise_data:
+                st.write(f"**Method:** {method_short}")
                 st.write(f"**Cam:** {cam_suggestion.split('(')[0] if cam_suggestion else 'TBD'}")
                 if "block_setting" in rise_data:
                     st.write(f"**Block Setting:** {rise_data['block_setting']:.3f}")
-                if "thread_time_data" in st.session_state:
-                    time_data = st.session_state["thread_time_data"]
+                if time_data:
                     st.write(f"**Time Required:** {time_data['total_time_required']:.2f} sec")
                     if time_data["fits_in_cycle"]:
                         st.write("**Status:** ✅ Fits in cycle")
@@ -1707,37 +1864,35 @@ def thread_calculator_section(setup_rpm=600):
     st.caption("📖 Based on official Davenport instruction manual (pages 135-151)")
     
     # Get threading specifications
-    stored_cam_data = st.session_state.get("thread_cam_data", {})
     setup_data = st.session_state.get("setup_data", {})
     
     material = setup_data.get("material", "Steel")
-    thread_len = stored_cam_data.get("cam_thread_length", 0.375)
-    tpi = stored_cam_data.get("cam_pitch", 24.0)
-    
-    # Get manual threading gear configurations for all methods
-    threading_gears = {
-        "6:1": get_manual_threading_gears("6:1"),
-        "2:1": get_manual_threading_gears("2:1"), 
-        "4:1": get_manual_threading_gears("4:1")
-    }
+    thread_len = specs.cam_thread_length
+    tpi = specs.cam_pitch
+    
+    # Get manual threading gear configurations for all methods (read-only module table,
+    # shared by every section below)
+    threading_gears = get_all_threading_gears()
     recommendations = get_threading_method_recommendation(material, thread_len, tpi)
     
     # Display threading method recommendations
     if recommendations:
         st.markdown("#### 🎯 Recommended Threading Method")
         primary_rec = recommendations[0]
-        primary_method = threading_gears[primary_rec["method"]]
+        primary_method = threading_gears[primary_rec.method]
         
-        st.success(f"**Primary Recommendation: {primary_rec['method']} Threading**")
-        st.caption(f"💡 {primary_rec['reason']}")
+        st.success(f"**Primary Recommendation: {primary_rec.method} Threading**")
+        st.caption(f"💡 {primary_rec.reason}")
         
         # Show primary method details
         col1, col2 = st.columns(2)
         with col1:
             st.markdown(f"**{primary_method['description']}**")
-            st.write(f"**Combined Ratio:** {primary_method['combined_ratio']}")
-            st.write(f"**RPM Formula:** {primary_method['rpm_formula']}")
-            st.write(f"**Cam Usage:** {primary_method['cam_spaces']}")
+            write_lines(
+                f"**Combined Ratio:** {primary_method['combined_ratio']}",
+                f"**RPM Formula:** {primary_method['rpm_formula']}",
+                f"**Cam Usage:** {primary_method['cam_spaces']}"
+            )
         
         with col2:
             st.markdown("**Gear Configuration:**")
@@ -1755,13 +1910,15 @@ def thread_calculator_section(setup_rpm=600):
         if len(recommendations) > 1:
             st.markdown("#### 🔄 Alternative Methods")
             for alt_rec in recommendations[1:]:
-                alt_method = threading_gears[alt_rec["method"]]
-                with st.expander(f"{alt_rec['method']} Threading - {alt_rec['reason']}", expanded=False):
+                alt_method = threading_gears[alt_rec.method]
+                with st.expander(f"{alt_rec.method} Threading - {alt_rec.reason}", expanded=False):
                     col1, col2 = st.columns(2)
                     with col1:
-                        st.write(f"**Ratio:** {alt_method['combined_ratio']}")
-                        st.write(f"**RPM:** {alt_method['rpm_formula']}")
-                        st.write(f"**Cam Usage:** {alt_method['cam_spaces']}")
+                        write_lines(
+                            f"**Ratio:** {alt_method['combined_ratio']}",
+                            f"**RPM:** {alt_method['rpm_formula']}",
+                            f"**Cam Usage:** {alt_method['cam_spaces']}"
+                        )
                     with col2:
                         st.markdown("**Gear Configuration:**")
                         for gear_ratio in alt_method["gear_ratios"]:
@@ -1772,7 +1929,8 @@ def thread_calculator_section(setup_rpm=600):
     
     # Manual gear reference table
     st.markdown("#### 📋 Complete Threading Gear Reference")
-    with st.expander("View All Threading Methods", expanded=False):
+    # A checkbox rather than an expander: collapsed expanders still build their contents every rerun
+    if st.checkbox("View All Threading Methods", key="show_all_threading_methods"):
         for method_key, method_data in threading_gears.items():
             st.markdown(f"**{method_data['description']}**")
             
@@ -1796,11 +1954,8 @@ def thread_calculator_section(setup_rpm=600):
             st.markdown("---")
     
     # Link to threading calculator results
-    rise_data = st.session_state.get("thread_rise_data", {})
     if rise_data:
-        calculated_method = rise_data.get("method", "")
-        if calculated_method:
-            method_short = calculated_method.split()[0]  # "6:1", "2:1", or "4:1"
+        if method_short:
             st.success(f"✅ **Threading Calculator Result:** {method_short} method recommended")
             st.caption("🔗 This matches the gear configuration shown above")
 
@@ -1809,36 +1964,28 @@ def thread_calculator_section(setup_rpm=600):
         st.markdown("---")
         st.markdown("### 🔄 Send Results to CAM Operations")
         
-        rise_data = st.session_state.get("thread_rise_data", {})
-        time_data = st.session_state.get("thread_time_data", {})
-        
         if rise_data and time_data:
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric("Total Time Required", f"{time_data.get('total_time_required', 0):.2f} sec")
-                st.metric("Rise Needed", f"{rise_data.get('rise_needed', 0):.4f}\"")
-            with col2:
-                st.metric("Threading Method", rise_data.get("method", "").split()[0])
-                if "block_setting" in rise_data:
-                    st.metric("Block Setting", f"{rise_data['block_setting']:.3f}")
+            # Read-only summary as a single table row
+            results_row = {
+                "Total Time Required": f"{time_data.get('total_time_required', 0):.2f} sec",
+                "Rise Needed": f"{rise_data.get('rise_needed', 0):.4f}\"",
+                "Threading Method": method_short,
+            }
+            if "block_setting" in rise_data:
+                results_row["Block Setting"] = f"{rise_data['block_setting']:.3f}"
+            st.dataframe([results_row], use_container_width=True, hide_index=True)
             
             if st.button("📤 Send Results to CAM Operations", key="send_thread_results"):
                 # Get recommended gears from manual-based system
-                calculated_method = rise_data.get("method", "")
                 recommended_gear_string = ""
-                method_short = ""
                 
-                if calculated_method:
-                    method_short = calculated_method.split()[0]
-                    threading_gears = get_all_threading_gears()
-                    
-                    if method_short in threading_gears:
-                        selected_method = threading_gears[method_short]
-                        # Get the main gear configuration
-                        for gear_ratio in selected_method["gear_ratios"]:
-                            if isinstance(gear_ratio["driver"], int):
-                                recommended_gear_string = f"{gear_ratio['driver']}-{gear_ratio['driven']}"
-                                break
+                if method_short in threading_gears:
+                    selected_method = threading_gears[method_short]
+                    # Get the main gear configuration
+                    for gear_ratio in selected_method["gear_ratios"]:
+                        if isinstance(gear_ratio["driver"], int):
+                            recommended_gear_string = f"{gear_ratio['driver']}-{gear_ratio['driven']}"
+                            break
                 
                 # Create thread results with proper structure for CAM Operations display
                 thread_results = {
@@ -1854,18 +2001,10 @@ def thread_calculator_section(setup_rpm=600):
                 
                 # Add block setting and timing data based on calculated method
                 if "block_setting" in rise_data:
-                    if method_short == "6:1":
-                        thread_results["block_setting_6to1"] = rise_data["block_setting"]
-                        thread_results["6to1_time"] = time_data.get("total_time_required", 0)
-                        thread_results["cam_suggestion_6to1"] = rise_data.get("cam_suggestion", "")
-                    elif method_short == "2:1":
-                        thread_results["block_setting_2to1"] = rise_data["block_setting"]
-                        thread_results["2to1_time"] = time_data.get("total_time_required", 0)
-                        thread_results["cam_suggestion_2to1"] = rise_data.get("cam_suggestion", "")
-                    elif method_short == "4:1":
-                        thread_results["block_setting_4to1"] = rise_data["block_setting"]
-                        thread_results["4to1_time"] = time_data.get("total_time_required", 0)
-                        thread_results["cam_suggestion_4to1"] = rise_data.get("cam_suggestion", "")
+                    suffix = method_info["result_suffix"]
+                    thread_results[f"block_setting_{suffix}"] = rise_data["block_setting"]
+                    thread_results[f"{suffix}_time"] = time_data.get("total_time_required", 0)
+                    thread_results[f"cam_suggestion_{suffix}"] = rise_data.get("cam_suggestion", "")
                 
                 st.session_state["thread_calc_results"] = thread_results
                 st.success("✅ Results sent to CAM Operations!")
@@ -1899,50 +2038,45 @@ def thread_calculator_section(setup_rpm=600):
     st.caption("📖 Use the gear configurations shown above based on your threading method")
     
     # Show selected threading method from calculator
-    rise_data = st.session_state.get("thread_rise_data", {})
     if rise_data:
-        calculated_method = rise_data.get("method", "")
-        if calculated_method:
-            method_short = calculated_method.split()[0]  # "6:1", "2:1", or "4:1"
-            threading_gears = get_all_threading_gears()
+        if method_short in threading_gears:
+            selected_method = threading_gears[method_short]
             
-            if method_short in threading_gears:
-                selected_method = threading_gears[method_short]
-                
-                st.success(f"**Selected Method: {selected_method['description']}**")
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown("**Gear Installation:**")
-                    for gear_ratio in selected_method["gear_ratios"]:
-                        if isinstance(gear_ratio["driver"], int):
-                            gear_string = f"{gear_ratio['driver']}-{gear_ratio['driven']}"
-                            st.write(f"• **{gear_string}** ({gear_ratio['description']})")
-                            
-                            # Store recommended gears for CAM Operations
-                            if st.button(f"📤 Send {gear_string} to CAM Operations", key=f"send_gear_{gear_string}"):
-                                st.session_state["recommended_threading_gears"] = gear_string
-                                st.success(f"✅ Gear configuration {gear_string} sent to CAM Operations!")
-                        else:
-                            st.write(f"• {gear_ratio['description']}")
+            st.success(f"**Selected Method: {selected_method['description']}**")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("**Gear Installation:**")
+                for gear_ratio in selected_method["gear_ratios"]:
+                    if isinstance(gear_ratio["driver"], int):
+                        gear_string = f"{gear_ratio['driver']}-{gear_ratio['driven']}"
+                        st.write(f"• **{gear_string}** ({gear_ratio['description']})")
+                        
+                        # Store recommended gears for CAM Operations
+                        if st.button(f"📤 Send {gear_string} to CAM Operations", key=f"send_gear_{gear_string}"):
+                            st.session_state["recommended_threading_gears"] = gear_string
+                            st.success(f"✅ Gear configuration {gear_string} sent to CAM Operations!")
+                    else:
+                        st.write(f"• {gear_ratio['description']}")
+            
+            with col2:
+                st.markdown("**Setup Verification:**")
+                write_lines(
+                    f"• Combined ratio: {selected_method['combined_ratio']}",
+                    f"• Threading RPM: {selected_method['rpm_formula']}",
+                    f"• Cam timing: {selected_method['cam_spaces']}"
+                )
                 
-                with col2:
-                    st.markdown("**Setup Verification:**")
-                    st.write(f"• Combined ratio: {selected_method['combined_ratio']}")
-                    st.write(f"• Threading RPM: {selected_method['rpm_formula']}")
-                    st.write(f"• Cam timing: {selected_method['cam_spaces']}")
-                    
-                    # Calculate actual threading RPM if work RPM is available
-                    work_rpm = rise_data.get("work_rpm", 0)
-                    if work_rpm > 0:
-                        actual_threading_rpm = work_rpm * selected_method['combined_ratio']
-                        st.write(f"• **Calculated:** {actual_threading_rpm:.0f} threading RPM")
+                # Calculate actual threading RPM if work RPM is available
+                work_rpm = rise_data.get("work_rpm", 0)
+                if work_rpm > 0:
+                    actual_threading_rpm = work_rpm * selected_method['combined_ratio']
+                    st.write(f"• **Calculated:** {actual_threading_rpm:.0f} threading RPM")
     else:
         st.info("💡 Complete threading calculations above to see specific gear recommendations")
         
         # Show general manual reference
         st.markdown("**Manual Reference - Threading Gear Overview:**")
-        threading_gears = get_all_threading_gears()
         
         for method_key, method_data in threading_gears.items():
             with st.expander(f"{method_data['description']}", expanded=False):
@@ -1953,146 +2087,121 @@ def thread_calculator_section(setup_rpm=600):
                         st.write(f"**Setup:** {gear_ratio['description']}")
                 st.write(f"**Result:** {method_data['rpm_formula']}")
                 st.write(f"**Applications:** {', '.join(method_data['typical_applications'])}")
-    
-    # Auto-fill results back to CAM Operations
-    if auto_fill_tool:
-        st.markdown("---")
-        st.markdown("### 🔄 Send Results to CAM Operations")
-        
-        # Check if calculations have been done
-        calc_done = 'time_required_6to1' in locals() and 'recommended_gears' in locals()
-        
-        if calc_done:
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("6:1 Threading Time", f"{time_required_6to1:.2f} sec")
-            with col2:
-                st.metric("2:1 Threading Time", f"{time_required_2to1:.2f} sec")
-            with col3:
-                st.metric("4:1 Threading Time", f"{time_required_4to1:.2f} sec")
-            
-            send_col1, send_col2 = st.columns(2)
-            with send_col1:
-                if st.button("📤 Send Results to CAM Operations", key="send_thread_results"):
-                    # Store calculated results including block settings
-                    thread_results = {
-                        "tool_type": auto_fill_tool,
-                        "position": auto_fill_position,
-                        "recommended_gears": recommended_gears[0]['gears'] if recommended_gears else "",
-                        "6to1_time": time_required_6to1,
-                        "2to1_time": time_required_2to1,
-                        "4to1_time": time_required_4to1,
-                        "rise_6to1": rise_needed_6to1,
-                        "rise_2to1": rise_needed_2to1,
-                        "rise_4to1": rise_needed_4to1,
-                        "cam_suggestion_6to1": cam_suggestion_6to1,
-                        "cam_suggestion_2to1": cam_suggestion_2to1,
-                        "cam_suggestion_4to1": cam_suggestion_4to1
-                    }
-                    
-                    # Add block settings if available
-                    if 'block_setting_6to1' in locals():
-                        thread_results["block_setting_6to1"] = block_setting_6to1
-                    if 'block_setting_2to1' in locals():
-                        thread_results["block_setting_2to1"] = block_setting_2to1
-                    if 'block_setting_4to1' in locals():
-                        thread_results["block_setting_4to1"] = block_setting_4to1
-                    
-                    st.session_state["thread_calc_results"] = thread_results
-                    st.success("✅ Results sent to CAM Operations! Switch to CAM Operations tab to see auto-filled data.")
-            with send_col2:
-                if st.button("🔙 Return to CAM Operations", key="return_to_cam"):
-                    st.info("Switch to CAM Operations tab to continue setup.")
-        else:
-            st.info("Complete the calculations above first, then results will appear here.")
 
 def generate_setup_sheet(setup_data, spindle_data):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Setup Sheet"
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, Alignment, Border, Side, NamedStyle
+    from openpyxl.utils import get_column_letter
+    from openpyxl.utils.cell import coordinate_to_tuple
+
+    # Write-only workbook: cells are collected per row and streamed out with ws.append
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Setup Sheet")
     header_font = Font(bold=True)
     border = Border(left=Side(style="thin"), right=Side(style="thin"), top=Side(style="thin"), bottom=Side(style="thin"))
     center_align = Alignment(horizontal="center")
-    ws.merge_cells("A1:K1")
+    # Bordered, centered header and table cells share named styles (one style write per cell)
+    wb.add_named_style(NamedStyle(name="setup_header", font=header_font, border=border, alignment=center_align))
+    wb.add_named_style(NamedStyle(name="setup_body", border=border, alignment=center_align))
+    rows = defaultdict(dict)
+    col_widths = {}
+
+    def put(ref, value=None, font=None, alignment=None, style=None, track=True):
+        row, col = coordinate_to_tuple(ref)
+        cell = WriteOnlyCell(ws, value=value)
+        if style:
+            cell.style = style
+        if font:
+            cell.font = font
+        if alignment:
+            cell.alignment = alignment
+        rows[row][col] = cell
+        if track and value is not None:
+            column = get_column_letter(col)
+            col_widths[column] = max(col_widths.get(column, 0), len(str(value)))
+
+    def put_headers(row, headers):
+        for col, header in enumerate(headers, 1):
+            put(f"{get_column_letter(col)}{row}", header, style="setup_header")
+
     machine_name = setup_data.get("machine_type", "Davenport Model B")
-    ws["A1"] = f"MACHINE: {machine_name}"
-    ws["A1"].font = header_font
-    ws["A1"].alignment = center_align
-    ws.merge_cells("A2:K2")
-    ws["A2"] = "Operator/Lead Person Layout Instructions"
-    ws["A2"].font = header_font
-    ws["A2"].alignment = center_align
-    headers = ["Part No.", "Internal Rev.", "Tool No.", "Tool Location", "Job No.", "Orig Date", "", "Updated", "Updated by", "Approved", ""]
-    for col, header in enumerate(headers, 1):
-        ws.cell(row=4, column=col).value = header
-        ws.cell(row=4, column=col).font = header_font
-        ws.cell(row=4, column=col).border = border
-        ws.cell(row=4, column=col).alignment = center_align
-    ws["A5"] = setup_data["job_name"]
-    ws["B5"] = "NA"
-    ws["I5"] = "TJ"
-    headers = ["Material", "", "Size", "Shape", "Feet Per M", "Bars Per M", "Lbs. Per M", "", "Collets", "Feed Finger", "Set Pads", "Burr. Collect"]
-    for col, header in enumerate(headers, 1):
-        ws.cell(row=6, column=col).value = header
-        ws.cell(row=6, column=col).font = header_font
-        ws.cell(row=6, column=col).border = border
-        ws.cell(row=6, column=col).alignment = center_align
-    ws["A7"] = setup_data["material"]
-    ws["C7"] = setup_data["dia"]
-    ws["D7"] = setup_data["bar_shape"]
-    ws["I7"] = setup_data["collets"]
-    ws["J7"] = setup_data["feed_finger"]
-    ws["K7"] = setup_data["set_pads"]
-    ws["L7"] = setup_data["burr_collect"]
-    headers = ["Spindle Speed", "", "S.F.M.", "Drill", "Tap", "Spindle Gears", "Machine Code", "", "Sec", "Feed Gears", "Thread Speed", "Threading Gears", "Eff. Rev"]
-    for col, header in enumerate(headers, 1):
-        ws.cell(row=8, column=col).value = header
-        ws.cell(row=8, column=col).font = header_font
-        ws.cell(row=8, column=col).border = border
-        ws.cell(row=8, column=col).alignment = center_align
-    ws["A9"] = setup_data["rpm"]
-    ws["C9"] = setup_data["sfm"]
-    ws["F9"] = setup_data["spindle_gears"]
-    ws["G9"] = setup_data["machine_code"]
-    ws["I9"] = setup_data["cycle_time"]
-    ws["J9"] = setup_data["feed_gears"]
-    ws["L9"] = setup_data["thread_gears"]
-    ws["M9"] = 59
-    headers = ["Position", "Operation", "CAM", "CAM Spaces", "Feed", "Feed Per Rev.", "Effective Revs", "Location", "", "Tool Slide", "", "Cross Slide"]
-    for col, header in enumerate(headers, 1):
-        ws.cell(row=10, column=col).value = header
-        ws.cell(row=10, column=col).font = header_font
-        ws.cell(row=10, column=col).border = border
-        ws.cell(row=10, column=col).alignment = center_align
+    put("A1", f"MACHINE: {machine_name}", header_font, alignment=center_align, track=False)
+    put("A2", "Operator/Lead Person Layout Instructions", header_font, alignment=center_align, track=False)
+    put_headers(4, ["Part No.", "Internal Rev.", "Tool No.", "Tool Location", "Job No.", "Orig Date", "", "Updated", "Updated by", "Approved", ""])
+    put("A5", setup_data["job_name"])
+    put("B5", "NA")
+    put("I5", "TJ")
+    put_headers(6, ["Material", "", "Size", "Shape", "Feet Per M", "Bars Per M", "Lbs. Per M", "", "Collets", "Feed Finger", "Set Pads", "Burr. Collect"])
+    put("A7", setup_data["material"])
+    put("C7", setup_data["dia"])
+    put("D7", setup_data["bar_shape"])
+    put("I7", setup_data["collets"])
+    put("J7", setup_data["feed_finger"])
+    put("K7", setup_data["set_pads"])
+    put("L7", setup_data["burr_collect"])
+    put_headers(8, ["Spindle Speed", "", "S.F.M.", "Drill", "Tap", "Spindle Gears", "Machine Code", "", "Sec", "Feed Gears", "Thread Speed", "Threading Gears", "Eff. Rev"])
+    put("A9", setup_data["rpm"])
+    put("C9", setup_data["sfm"])
+    put("F9", setup_data["spindle_gears"])
+    put("G9", setup_data["machine_code"])
+    put("I9", setup_data["cycle_time"])
+    put("J9", setup_data["feed_gears"])
+    put("L9", setup_data["thread_gears"])
+    put("M9", 59)
+    put_headers(10, ["Position", "Operation", "CAM", "CAM Spaces", "Feed", "Feed Per Rev.", "Effective Revs", "Location", "", "Tool Slide", "", "Cross Slide"])
     for i, spindle in enumerate(spindle_data, start=12):
-        ws[f"A{i}"] = spindle["position"]
-        ws[f"B{i}"] = spindle["operation"]
-        ws[f"C{i}"] = spindle["cam"]
-        ws[f"D{i}"] = spindle["cam_spaces"]
-        ws[f"E{i}"] = spindle["feed"]
-        ws[f"F{i}"] = spindle["feed_per_rev"]
-        ws[f"G{i}"] = spindle.get("effective_revs", 0)
-        ws[f"H{i}"] = spindle["location"]
-        ws[f"J{i}"] = spindle["tool_slide"]
-        ws[f"L{i}"] = spindle["cross_slide"]
+        values = {
+            "A": spindle["position"],
+            "B": spindle["operation"],
+            "C": spindle["cam"],
+            "D": spindle["cam_spaces"],
+            "E": spindle["feed"],
+            "F": spindle["feed_per_rev"],
+            "G": spindle.get("effective_revs", 0),
+            "H": spindle["location"],
+            "J": spindle["tool_slide"],
+            "L": spindle["cross_slide"],
+        }
         for col in range(1, 13):
-            ws.cell(row=i, column=col).border = border
-            ws.cell(row=i, column=col).alignment = center_align
-    ws["A31"] = "FORM # 409-6 10-04-11-B"
-    ws.merge_cells("D31:K31")
-    ws["D31"] = "CONFIDENTIAL DOCUMENT: Distribution outside of KKSP employees is strictly prohibited"
-    ws["D31"].font = Font(italic=True)
-    for col in ws.columns:
-        max_length = 0
-        column = col[0].column_letter
-        for cell in col:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = max_length + 2
-        ws.column_dimensions[column].width = adjusted_width
+            column = get_column_letter(col)
+            put(f"{column}{i}", values.get(column), style="setup_body")
+    put("A31", "FORM # 409-6 10-04-11-B")
+    put("D31", "CONFIDENTIAL DOCUMENT: Distribution outside of KKSP employees is strictly prohibited", Font(italic=True), track=False)
+
+    # Column widths and merges must be set before any rows are streamed
+    for column, width in col_widths.items():
+        ws.column_dimensions[column].width = width + 2
+    for cell_range in ("A1:K1", "A2:K2", "D31:K31"):
+        ws.merged_cells.add(cell_range)
+    for row in range(1, max(rows) + 1):
+        cells = rows.get(row)
+        if not cells:
+            ws.append([])
+            continue
+        ws.append([cells.get(col) for col in range(1, max(cells) + 1)])
+
+    # Add cutoff operations sheet (one row per position, streamed by the
+    # write-only workbook like the setup sheet above)
+    cutoff_data = st.session_state.get("cutoff_data")
+    if cutoff_data:
+        cutoff_ws = wb.create_sheet("Cutoff Operations")
+        cutoff_headers = []
+        for header in ("Position", "Wall Thickness", "Feed Rate", "Required Rise", "Recommended Cam"):
+            cell = WriteOnlyCell(cutoff_ws, value=header)
+            cell.font = header_font
+            cutoff_headers.append(cell)
+        cutoff_ws.append(cutoff_headers)
+        for pos_key, cutoff_info in cutoff_data.items():
+            position = pos_key.replace("position_", "")
+            best_cam = cutoff_info.get('cam_recommendations', [{}])[0]
+            cutoff_ws.append((
+                position,
+                f"{cutoff_info.get('wall_thickness', 0):.3f}",
+                f"{cutoff_info.get('recommended_feed', 0):.4f}",
+                f"{cutoff_info.get('required_rise', 0):.3f}",
+                best_cam.get('cam_id', 'N/A')
+            ))
     output = BytesIO()
     wb.save(output)
     output.seek(0)
@@ -2182,6 +2291,7 @@ def create_material_removal_simulation(setup_data, spindle_data, machine_config,
                                      animation_steps=50, view_angle="Isometric", 
                                      color_scheme="Default", visualization_mode="Simple Point Cloud"):
     """Create detailed material removal simulation"""
+    import plotly.graph_objects as go
     
     # Show info about visualization mode
     if visualization_mode == "Advanced 3D Mesh":
@@ -2189,6 +2299,17 @@ def create_material_removal_simulation(setup_data, spindle_data, machine_config,
     else:
         st.success("✅ Using Simple Point Cloud mode - better for animation")
     
+    # The figure only depends on the setup, the operations and the view options, so
+    # reruns from other widgets reuse the one built last time
+    simulation_key = repr((setup_data, spindle_data, machine_config, show_toolpaths, show_material_removal,
+                           workpiece_opacity, tool_scale, animation_steps, view_angle, color_scheme))
+    cached_simulation = st.session_state.get("_simulation_figure")
+    if cached_simulation and cached_simulation[0] == simulation_key:
+        fig, removal_status = cached_simulation[1]
+        if show_material_removal:
+            show_material_removal_status(*removal_status, animation_steps)
+        return fig
+    
     # Get workpiece parameters
     bar_diameter = setup_data.get("dia", 0.5)
     bar_length = setup_data.get("part_length", 2.0)
@@ -2224,10 +2345,12 @@ def create_material_removal_simulation(setup_data, spindle_data, machine_config,
     ))
     
     # Process each operation and show material removal
+    removal_status = None
     if show_material_removal:
-        removed_volume = create_material_removal_visualization(
+        removal_status = create_material_removal_visualization(
             fig, setup_data, spindle_data, machine_config, colors, animation_steps
         )
+        show_material_removal_status(*removal_status, animation_steps)
     
     # Add tool paths
     if show_toolpaths:
@@ -2264,10 +2387,12 @@ def create_material_removal_simulation(setup_data, spindle_data, machine_config,
         ] if show_material_removal else []
     )
     
+    st.session_state["_simulation_figure"] = (simulation_key, (fig, removal_status))
     return fig
 
+@st.cache_resource(show_spinner=False, max_entries=16)
 def create_cylindrical_workpiece(diameter, length, resolution=20):
-    """Create a cylindrical workpiece mesh"""
+    """Create a cylindrical workpiece mesh (cached and shared, so the arrays are read-only)"""
     radius = diameter / 2
     
     # Create cylinder with end caps
@@ -2278,69 +2403,50 @@ def create_cylindrical_workpiece(diameter, length, resolution=20):
     theta = np.linspace(0, 2*np.pi, n_theta, endpoint=False)
     z_vals = np.linspace(0, length, n_z)
     
-    vertices = []
-    
-    # Add center points for end caps
-    vertices.append([0, 0, 0])       # Bottom center
-    vertices.append([0, 0, length])  # Top center
-    
-    # Add cylindrical surface points
-    for z_val in z_vals:
-        for theta_val in theta:
-            x = radius * np.cos(theta_val)
-            y = radius * np.sin(theta_val)
-            vertices.append([x, y, z_val])
-    
-    vertices = np.array(vertices)
-    x, y, z = vertices[:, 0], vertices[:, 1], vertices[:, 2]
+    # Bottom and top center points for the end caps, then the cylindrical surface
+    # points layer by layer (theta varies fastest)
+    theta_grid, z_grid = np.meshgrid(theta, z_vals)
+    x = np.concatenate(([0.0, 0.0], radius * np.cos(theta_grid).ravel()))
+    y = np.concatenate(([0.0, 0.0], radius * np.sin(theta_grid).ravel()))
+    z = np.concatenate(([0.0, length], z_grid.ravel()))
     
     # Create faces
-    faces = []
+    theta_idx = np.arange(n_theta)
+    next_theta = np.roll(theta_idx, -1)
     
-    # Bottom cap (connect to bottom center)
-    for i in range(n_theta):
-        next_i = (i + 1) % n_theta
-        v_center = 0  # Bottom center
-        v_curr = 2 + i  # Current bottom edge point
-        v_next = 2 + next_i  # Next bottom edge point
-        faces.append([v_center, v_next, v_curr])
-    
-    # Top cap (connect to top center)
+    # Bottom cap (connect to bottom center) and top cap (connect to top center)
     top_layer_offset = 2 + (n_z - 1) * n_theta
-    for i in range(n_theta):
-        next_i = (i + 1) % n_theta
-        v_center = 1  # Top center
-        v_curr = top_layer_offset + i  # Current top edge point
-        v_next = top_layer_offset + next_i  # Next top edge point
-        faces.append([v_center, v_curr, v_next])
+    bottom_cap = np.stack([np.zeros(n_theta, dtype=np.int64), 2 + next_theta, 2 + theta_idx], axis=1)
+    top_cap = np.stack([np.ones(n_theta, dtype=np.int64), top_layer_offset + theta_idx, top_layer_offset + next_theta], axis=1)
     
-    # Cylindrical surface
-    for z_idx in range(n_z - 1):
-        for theta_idx in range(n_theta):
-            next_theta = (theta_idx + 1) % n_theta
-            
-            # Current layer indices
-            v1 = 2 + z_idx * n_theta + theta_idx
-            v2 = 2 + z_idx * n_theta + next_theta
-            
-            # Next layer indices
-            v3 = 2 + (z_idx + 1) * n_theta + theta_idx
-            v4 = 2 + (z_idx + 1) * n_theta + next_theta
-            
-            # Two triangles per quad
-            faces.extend([[v1, v2, v3], [v2, v4, v3]])
+    # Cylindrical surface: current layer (v1, v2) and next layer (v3, v4) indices
+    layer_start = 2 + np.arange(n_z - 1)[:, None] * n_theta
+    v1 = layer_start + theta_idx
+    v2 = layer_start + next_theta
+    v3 = v1 + n_theta
+    v4 = v2 + n_theta
     
-    faces = np.array(faces)
+    # Two triangles per quad
+    surface = np.stack([v1, v2, v3, v2, v4, v3], axis=-1).reshape(-1, 3)
     
-    return {
+    faces = np.concatenate((bottom_cap, top_cap, surface))
+    
+    mesh = {
         'x': x, 'y': y, 'z': z,
         'i': faces[:, 0], 'j': faces[:, 1], 'k': faces[:, 2]
     }
+    for array in mesh.values():
+        array.setflags(write=False)
+    return MappingProxyType(mesh)
 
 def create_material_removal_visualization(fig, setup_data, spindle_data, machine_config, colors, steps):
-    """Create simplified material removal visualization with step-by-step animation"""
+    """Create simplified material removal visualization with step-by-step animation
+
+    Returns the debug messages and the number of operations shown, for
+    show_material_removal_status
+    """
+    import plotly.graph_objects as go
     
-    removed_volumes = []
     debug_info = []
     bar_diameter = setup_data.get("dia", 0.5)
     bar_length = setup_data.get("part_length", 2.0)
@@ -2356,8 +2462,10 @@ def create_material_removal_visualization(fig, setup_data, spindle_data, machine
         removal_viz = create_simple_removal_zone(operation, setup_data, machine_config)
         
         if removal_viz and len(removal_viz.get('x', [])) > 0:
+            # Single precision is plenty for display and halves the points sent to the browser
+            for axis in ('x', 'y', 'z'):
+                removal_viz[axis] = np.asarray(removal_viz[axis], dtype=np.float32)
             valid_operations.append((operation, removal_viz))
-            removed_volumes.append(removal_viz.get('volume', 0))
             debug_info.append(f"✅ Added removal for {operation.get('position', '')}: {operation.get('operation', '')} - Volume: {removal_viz.get('volume', 0):.6f} in³")
         else:
             debug_info.append(f"⚠️ No removal data for {operation.get('position', '')}: {operation.get('operation', '')}")
@@ -2367,43 +2475,67 @@ def create_material_removal_visualization(fig, setup_data, spindle_data, machine
         # Create frames for step-by-step animation
         frames = []
         
+        # The workpiece is the same in every frame, so its mesh is built once
+        workpiece_mesh = create_cylindrical_workpiece(bar_diameter, bar_length)
+        workpiece_trace = dict(
+            x=workpiece_mesh['x'],
+            y=workpiece_mesh['y'], 
+            z=workpiece_mesh['z'],
+            i=workpiece_mesh['i'],
+            j=workpiece_mesh['j'],
+            k=workpiece_mesh['k'],
+            name="Workpiece",
+            color=colors["workpiece"],
+            opacity=0.7,
+            showscale=False
+        )
+        
+        # All removal points in operation order; a frame showing the first n operations
+        # draws the first point_ends[n] points as a single trace
+        removal_x = np.concatenate([removal_viz['x'] for _, removal_viz in valid_operations])
+        removal_y = np.concatenate([removal_viz['y'] for _, removal_viz in valid_operations])
+        removal_z = np.concatenate([removal_viz['z'] for _, removal_viz in valid_operations])
+        point_ends = np.cumsum([0] + [len(removal_viz['x']) for _, removal_viz in valid_operations])
+        removal_marker = dict(
+            size=6,
+            color=colors["removed"],
+            opacity=0.9,
+            symbol='circle'
+        )
+        
         for step in range(steps + 1):
             frame_data = []
             
             # Always show workpiece
-            workpiece_mesh = create_cylindrical_workpiece(bar_diameter, bar_length)
-            frame_data.append(go.Mesh3d(
-                x=workpiece_mesh['x'],
-                y=workpiece_mesh['y'], 
-                z=workpiece_mesh['z'],
-                i=workpiece_mesh['i'],
-                j=workpiece_mesh['j'],
-                k=workpiece_mesh['k'],
-                name="Workpiece",
-                color=colors["workpiece"],
-                opacity=0.7,
-                showscale=False
-            ))
+            frame_data.append(go.Mesh3d(**workpiece_trace))
             
             # Show operations up to current step
             operations_to_show = int((step / steps) * len(valid_operations)) if steps > 0 else len(valid_operations)
             
-            for i, (operation, removal_viz) in enumerate(valid_operations[:operations_to_show]):
-                # Add removal visualization as scatter points
-                frame_data.append(go.Scatter3d(
-                    x=removal_viz['x'],
-                    y=removal_viz['y'],
-                    z=removal_viz['z'],
-                    mode='markers',
-                    marker=dict(
-                        size=6,
-                        color=colors["removed"],
-                        opacity=0.9,
-                        symbol='circle'
-                    ),
-                    name=f"Removed by {operation.get('position', '')}: {operation.get('operation', '')}",
-                    showlegend=(step == steps)  # Only show legend on final frame
-                ))
+            # Add removal visualization as scatter points
+            shown_points = point_ends[operations_to_show]
+            frame_data.append(go.Scatter3d(
+                x=removal_x[:shown_points],
+                y=removal_y[:shown_points],
+                z=removal_z[:shown_points],
+                mode='markers',
+                marker=removal_marker,
+                name="Material Removed",
+                showlegend=False
+            ))
+            
+            # Legend-only entries naming each operation on the final frame
+            if step == steps:
+                for operation, _ in valid_operations:
+                    frame_data.append(go.Scatter3d(
+                        x=[None],
+                        y=[None],
+                        z=[None],
+                        mode='markers',
+                        marker=removal_marker,
+                        name=f"Removed by {operation.get('position', '')}: {operation.get('operation', '')}",
+                        showlegend=True
+                    ))
             
             frames.append(go.Frame(data=frame_data, name=f"step_{step}"))
         
@@ -2480,6 +2612,10 @@ def create_material_removal_visualization(fig, setup_data, spindle_data, machine
                 showlegend=True
             ))
     
+    return debug_info, len(valid_operations)
+
+def show_material_removal_status(debug_info, operation_count, steps):
+    """Debug details and summary for the material removal visualization"""
     # Display debug information
     if debug_info:
         with st.expander("🔧 Material Removal Debug Info"):
@@ -2494,15 +2630,13 @@ def create_material_removal_visualization(fig, setup_data, spindle_data, machine
                     st.info(info)
     
     # Add helpful info
-    if len(removed_volumes) > 0:
+    if operation_count > 0:
         if steps > 1:
-            st.info(f"🎬 Animation: Click ▶️ Play to see {len(valid_operations)} operations in sequence. Use the slider to step through manually.")
+            st.info(f"🎬 Animation: Click ▶️ Play to see {operation_count} operations in sequence. Use the slider to step through manually.")
         else:
-            st.info(f"🔧 Material Removal: Showing {len(valid_operations)} operations as red point clouds.")
+            st.info(f"🔧 Material Removal: Showing {operation_count} operations as red point clouds.")
     else:
         st.warning("⚠️ No material removal detected. Check that operations have feed rates and effective revolutions.")
-    
-    return sum(removed_volumes)
 
 def create_simple_removal_zone(operation, setup_data, machine_config):
     """Create a simple point-based visualization of material removal"""
@@ -2818,7 +2952,11 @@ def create_side_working_removal(diameter, length, position, effective_revs, feed
 
 def add_enhanced_toolpaths(fig, setup_data, spindle_data, machine_config, colors, tool_scale):
     """Add enhanced tool path visualization"""
+    import plotly.graph_objects as go
     
+    # Collect every trace first and add them in one call so the figure is
+    # validated once rather than per operation
+    traces = []
     for i, operation in enumerate(spindle_data):
         if not operation.get('operation'):
             continue
@@ -2848,7 +2986,7 @@ def add_enhanced_toolpaths(fig, setup_data, spindle_data, machine_config, colors
         
         if path_coords:
             # Add tool path line
-            fig.add_trace(go.Scatter3d(
+            traces.append(go.Scatter3d(
                 x=path_coords['x'],
                 y=path_coords['y'],
                 z=path_coords['z'],
@@ -2861,7 +2999,7 @@ def add_enhanced_toolpaths(fig, setup_data, spindle_data, machine_config, colors
             # Add tool representation at current position
             tool_coords = create_tool_geometry(path_coords, tool_type, tool_scale)
             if tool_coords:
-                fig.add_trace(go.Scatter3d(
+                traces.append(go.Scatter3d(
                     x=tool_coords['x'],
                     y=tool_coords['y'],
                     z=tool_coords['z'],
@@ -2875,6 +3013,9 @@ def add_enhanced_toolpaths(fig, setup_data, spindle_data, machine_config, colors
                     ),
                     showlegend=False
                 ))
+    
+    if traces:
+        fig.add_traces(traces)
 
 def generate_end_working_path(diameter, length, effective_revs, feed, tool_scale):
     """Generate tool path for end-working operations"""
@@ -3057,8 +3198,7 @@ def simulation_section(setup_data, spindle_data, machine_config):
                         "Status": "✅ Optimized" if volume > 0 else "⚠️ Check Setup"
                     })
             
-            df_analysis = pd.DataFrame(analysis_data)
-            st.dataframe(df_analysis, use_container_width=True, hide_index=True)
+            st.dataframe(analysis_data, use_container_width=True, hide_index=True)
             
             # Summary metrics
             col1, col2, col3, col4 = st.columns(4)
@@ -3215,6 +3355,7 @@ def animate_machining_process(setup_data, spindle_data, machine_config):
 
 def create_animation_frame(setup_data, completed_operations, machine_config, frame_number):
     """Create a single frame of the animation showing progressive material removal"""
+    import plotly.graph_objects as go
     
     fig = go.Figure()
     
@@ -3342,6 +3483,7 @@ def create_step_by_step_simulation(setup_data, spindle_data, machine_config, ste
 
 def add_animated_tool(fig, operation, setup_data, machine_config, tool_color):
     """Add animated tool representation for the active operation"""
+    import plotly.graph_objects as go
     
     position = operation.get("location", 1)
     tool_type = operation.get("operation", "")
@@ -3446,6 +3588,7 @@ def generate_optimization_suggestions(spindle_data, setup_data, machine_config):
 
 def reference_charts_section():
     """Reference Charts & Tables section with JSON data loading"""
+    import pandas as pd
     st.header("📚 Reference Charts & Tables")
     
     # Load JSON data
@@ -3465,7 +3608,7 @@ def reference_charts_section():
         
         # Display search results
         if drill_search:
-            search_results = search_drill_sizes(drill_search, drill_data)
+            search_results = search_drill_sizes(drill_search)
             if search_results:
                 st.markdown(f"#### 🎯 Search Results for '{drill_search}':")
                 results_data = []
@@ -3531,7 +3674,7 @@ def reference_charts_section():
         
         # Display thread search results
         if thread_search:
-            search_results = search_thread_sizes(thread_search, thread_data)
+            search_results = search_thread_sizes(thread_search)
             if search_results:
                 st.markdown(f"#### 🎯 Search Results for '{thread_search}':")
                 results_data = []
@@ -3615,6 +3758,8 @@ def reference_charts_section():
 # ------------------------------
 
 def main():
+    st.set_page_config(page_title="Davenport CAM Assistant", layout="wide")
+
     # --- Cookie Setup ---
     cookies = EncryptedCookieManager(
         prefix="davenport_",  
@@ -3623,7 +3768,6 @@ def main():
     if not cookies.ready():
         st.stop()
 
-    st.set_page_config(page_title="Davenport CAM Assistant", layout="wide")
     material_data, sfm_guidelines, legacy_cam_data = load_data()
     st.title("Multi-Spindle CAM Setup Assistant")
 
@@ -3722,6 +3866,7 @@ def main():
         
         # Load Davenport cam data
         cam_data = load_machine_cam_data()
+        cam_lookup = load_cam_lookup()
         
         # Retrieve stored CAM operations data for persistence across tabs
         stored_cam_ops_data = st.session_state.get("cam_operations_data", {})
@@ -3751,12 +3896,12 @@ def main():
         temp_effective_revs = []
         for i in range(1, num_spindles + 1):
             # Get current values for this position
-            ew_travel = st.session_state.get(f"pos{i}_ew_travel", 0.0)
-            ew_approach = st.session_state.get(f"pos{i}_ew_approach", 0.0)
-            ew_feed = st.session_state.get(f"pos{i}_ew_feed", 0.0)
-            sw_travel = st.session_state.get(f"pos{i}_sw_travel", 0.0)
-            sw_approach = st.session_state.get(f"pos{i}_sw_approach", 0.0)
-            sw_feed = st.session_state.get(f"pos{i}_sw_feed", 0.0)
+            ew_travel = st.session_state.get(POS_KEYS[i]["ew_travel"], 0.0)
+            ew_approach = st.session_state.get(POS_KEYS[i]["ew_approach"], 0.0)
+            ew_feed = st.session_state.get(POS_KEYS[i]["ew_feed"], 0.0)
+            sw_travel = st.session_state.get(POS_KEYS[i]["sw_travel"], 0.0)
+            sw_approach = st.session_state.get(POS_KEYS[i]["sw_approach"], 0.0)
+            sw_feed = st.session_state.get(POS_KEYS[i]["sw_feed"], 0.0)
             
             # Calculate effective revs for both end and side
             ew_total = ew_travel + ew_approach
@@ -3772,14 +3917,18 @@ def main():
         # Find the overall maximum
         max_effective_revs = max(temp_effective_revs) if temp_effective_revs else 0
         
+        # Sorted tool lists are shared by every position's selector
+        end_tool_options = tuple(sorted(st.session_state.tool_library_end))
+        side_tool_options = tuple(sorted(st.session_state.tool_library_side))
+        
         for i in range(1, num_spindles + 1):
             # Calculate current position's effective revs for highlighting
-            ew_travel = st.session_state.get(f"pos{i}_ew_travel", 0.0)
-            ew_approach = st.session_state.get(f"pos{i}_ew_approach", 0.0)
-            ew_feed = st.session_state.get(f"pos{i}_ew_feed", 0.0)
-            sw_travel = st.session_state.get(f"pos{i}_sw_travel", 0.0)
-            sw_approach = st.session_state.get(f"pos{i}_sw_approach", 0.0)
-            sw_feed = st.session_state.get(f"pos{i}_sw_feed", 0.0)
+            ew_travel = st.session_state.get(POS_KEYS[i]["ew_travel"], 0.0)
+            ew_approach = st.session_state.get(POS_KEYS[i]["ew_approach"], 0.0)
+            ew_feed = st.session_state.get(POS_KEYS[i]["ew_feed"], 0.0)
+            sw_travel = st.session_state.get(POS_KEYS[i]["sw_travel"], 0.0)
+            sw_approach = st.session_state.get(POS_KEYS[i]["sw_approach"], 0.0)
+            sw_feed = st.session_state.get(POS_KEYS[i]["sw_feed"], 0.0)
             
             # Calculate effective revs for both end and side
             ew_total = ew_travel + ew_approach
@@ -3802,21 +3951,21 @@ def main():
                     with ew_col1:
                         ew_tool = enhanced_tool_selector(
                             "Tool Type (End)",
-                            sorted(st.session_state.tool_library_end),
-                            f"pos{i}_ew_tool",
+                            end_tool_options,
+                            POS_KEYS[i]["ew_tool"],
                             "tool_library_end",
                             "tool_library_end.json",
                             TOOL_DEFINITIONS
                         )
                         # Remove redundant assignment - enhanced_tool_selector handles session state via key
                         ew_travel = st.number_input("Tool Travel (End)", min_value=0.0, step=0.0001, format="%.4f", 
-                                                  value=stored_cam_ops_data.get(f"pos{i}_ew_travel", 0.0), key=f"pos{i}_ew_travel")
+                                                  value=stored_cam_ops_data.get(POS_KEYS[i]["ew_travel"], 0.0), key=POS_KEYS[i]["ew_travel"])
                         ew_approach = st.number_input("Approach (End)", min_value=0.0, step=0.001, format="%.3f", 
-                                                    value=stored_cam_ops_data.get(f"pos{i}_ew_approach", 0.0), key=f"pos{i}_ew_approach")
+                                                    value=stored_cam_ops_data.get(POS_KEYS[i]["ew_approach"], 0.0), key=POS_KEYS[i]["ew_approach"])
                         ew_feed = st.number_input("Feed (End)", min_value=0.0, step=0.0001, format="%.4f", 
-                                                value=stored_cam_ops_data.get(f"pos{i}_ew_feed", 0.0), key=f"pos{i}_ew_feed")
+                                                value=stored_cam_ops_data.get(POS_KEYS[i]["ew_feed"], 0.0), key=POS_KEYS[i]["ew_feed"])
                         ew_tool_desc = st.text_input("Tool Description (End)", 
-                                                   value=stored_cam_ops_data.get(f"pos{i}_ew_tool_desc", ""), key=f"pos{i}_ew_tool_desc")
+                                                   value=stored_cam_ops_data.get(POS_KEYS[i]["ew_tool_desc"], ""), key=POS_KEYS[i]["ew_tool_desc"])
                     with ew_col2:
                         ew_total = ew_travel + ew_approach
                         min_block, max_block = machine_config["block_ranges"].get(i, (0.8, 1.2))
@@ -3834,20 +3983,22 @@ def main():
                             if ew_total != 0.0:
                                 st.warning("Please select a tool type for End-Working.")
                         else:
-                            ew_cam = recommend_cam(ew_total, ew_total, ew_tool, cam_data, setup_data["material"], i, machine_config)
+                            ew_cam = recommend_cam(ew_total, ew_total, ew_tool, cam_data, setup_data["material"], i, machine_config, cam_lookup)
                             if ew_cam:
                                 cam_name, cam_info = ew_cam
                                 cam_rise = cam_info.get("rise", 0)
+                                cam_size = cam_info.get("size", "")
+                                cam_type = cam_info.get("type", "?")
                                 ew_block = ew_total / cam_rise if cam_rise else 0
                                 feed_per_rev = ew_feed / setup_data["rpm"] if setup_data["rpm"] else 0
-                                st.success(f"End Cam: Size {cam_info.get('size', '?')} – Cam #: {cam_name}")
-                                st.caption(f"Rise: {cam_rise:.4f}, Type: {cam_info.get('type', '?')}")
+                                st.success(f"End Cam: Size {cam_size or '?'} – Cam #: {cam_name}")
+                                st.caption(f"Rise: {cam_rise:.4f}, Type: {cam_type}")
                                 st.markdown(f"<div style='font-size:16px; font-weight:700; padding-top:2px;'>End Block Setting: {ew_block:.2f}</div>", unsafe_allow_html=True)
                                 spindle_data.append({
                                     "position": f"End{i}",
                                     "operation": ew_tool,
                                     "cam": cam_name,
-                                    "cam_spaces": cam_info.get("size", ""),
+                                    "cam_spaces": cam_size,
                                     "feed": ew_feed,
                                     "feed_per_rev": feed_per_rev,
                                     "effective_revs": ew_effective_revs,
@@ -3864,8 +4015,8 @@ def main():
                     with sw_col1:
                         sw_tool = enhanced_tool_selector(
                             "Tool Type (Side)",
-                            sorted(st.session_state.tool_library_side),
-                            f"pos{i}_sw_tool",
+                            side_tool_options,
+                            POS_KEYS[i]["sw_tool"],
                             "tool_library_side",
                             "tool_library_side.json",
                             TOOL_DEFINITIONS
@@ -3880,7 +4031,7 @@ def main():
                                 min_value=0.001, 
                                 step=0.001, 
                                 format="%.3f", 
-                                key=f"pos{i}_largest_dia",
+                                key=POS_KEYS[i]["largest_dia"],
                                 help="Enter the largest diameter for shave calculation"
                             )
                             smallest_dia = st.number_input(
@@ -3888,7 +4039,7 @@ def main():
                                 min_value=0.001, 
                                 step=0.001, 
                                 format="%.3f", 
-                                key=f"pos{i}_smallest_dia",
+                                key=POS_KEYS[i]["smallest_dia"],
                                 help="Enter the smallest diameter for shave calculation"
                             )
                             
@@ -3901,13 +4052,13 @@ def main():
                                 st.warning("⚠️ Largest diameter must be greater than smallest diameter")
                         
                         sw_travel = st.number_input("Tool Travel (Side)", min_value=0.0, step=0.0001, format="%.4f", 
-                                                   value=stored_cam_ops_data.get(f"pos{i}_sw_travel", 0.0), key=f"pos{i}_sw_travel")
+                                                   value=stored_cam_ops_data.get(POS_KEYS[i]["sw_travel"], 0.0), key=POS_KEYS[i]["sw_travel"])
                         sw_approach = st.number_input("Approach (Side)", min_value=0.0, step=0.001, format="%.3f", 
-                                                    value=stored_cam_ops_data.get(f"pos{i}_sw_approach", 0.0), key=f"pos{i}_sw_approach")
+                                                    value=stored_cam_ops_data.get(POS_KEYS[i]["sw_approach"], 0.0), key=POS_KEYS[i]["sw_approach"])
                         sw_feed = st.number_input("Feed (Side)", min_value=0.0, step=0.0001, format="%.4f", 
-                                                value=stored_cam_ops_data.get(f"pos{i}_sw_feed", 0.0), key=f"pos{i}_sw_feed")
+                                                value=stored_cam_ops_data.get(POS_KEYS[i]["sw_feed"], 0.0), key=POS_KEYS[i]["sw_feed"])
                         sw_tool_desc = st.text_input("Tool Description (Side)", 
-                                                   value=stored_cam_ops_data.get(f"pos{i}_sw_tool_desc", ""), key=f"pos{i}_sw_tool_desc")
+                                                   value=stored_cam_ops_data.get(POS_KEYS[i]["sw_tool_desc"], ""), key=POS_KEYS[i]["sw_tool_desc"])
                     with sw_col2:
                         sw_total = sw_travel + sw_approach
                         min_block, max_block = machine_config["block_ranges"].get(i, (0.8, 1.2))
@@ -3928,26 +4079,28 @@ def main():
                             # For SHAVE tools, use calculated rise if diameters are provided
                             target_rise_for_cam = sw_total  # Default
                             if sw_tool.strip().upper() == "SHAVE":
-                                largest_dia = st.session_state.get(f"pos{i}_largest_dia", 0)
-                                smallest_dia = st.session_state.get(f"pos{i}_smallest_dia", 0)
+                                largest_dia = st.session_state.get(POS_KEYS[i]["largest_dia"], 0)
+                                smallest_dia = st.session_state.get(POS_KEYS[i]["smallest_dia"], 0)
                                 if largest_dia > smallest_dia > 0:
                                     target_rise_for_cam = calculate_shave_cam_rise(largest_dia, smallest_dia)
                                     st.info(f"🎯 Using calculated rise for cam selection: {target_rise_for_cam:.4f} in")
                             
-                            sw_cam = recommend_cam(target_rise_for_cam, sw_total, sw_tool, cam_data, setup_data["material"], i, machine_config)
+                            sw_cam = recommend_cam(target_rise_for_cam, sw_total, sw_tool, cam_data, setup_data["material"], i, machine_config, cam_lookup)
                             if sw_cam:
                                 cam_name, cam_info = sw_cam
                                 cam_rise = cam_info.get("rise", 0)
+                                cam_size = cam_info.get("size", "")
+                                cam_type = cam_info.get("type", "?")
                                 sw_block = sw_total / cam_rise if cam_rise else 0
                                 feed_per_rev = sw_feed / setup_data["rpm"] if setup_data["rpm"] else 0
-                                st.success(f"Side Cam: Size {cam_info.get('size', '?')} – Cam #: {cam_name}")
-                                st.caption(f"Rise: {cam_rise:.4f}, Type: {cam_info.get('type', '?')}")
+                                st.success(f"Side Cam: Size {cam_size or '?'} – Cam #: {cam_name}")
+                                st.caption(f"Rise: {cam_rise:.4f}, Type: {cam_type}")
                                 st.markdown(f"<div style='font-size:16px; font-weight:700; padding-top:2px;'>Side Block Setting: {sw_block:.2f}</div>", unsafe_allow_html=True)
                                 spindle_data.append({
                                     "position": f"Side{i}",
                                     "operation": sw_tool,
                                     "cam": cam_name,
-                                    "cam_spaces": cam_info.get("size", ""),
+                                    "cam_spaces": cam_size,
                                     "feed": sw_feed,
                                     "feed_per_rev": feed_per_rev,
                                     "effective_revs": sw_effective_revs,
@@ -3962,8 +4115,8 @@ def main():
 
         schematic_station_data = []
         for i in range(1, num_spindles + 1):
-            end_tool = st.session_state.get(f"pos{i}_ew_tool", "")
-            side_tool = st.session_state.get(f"pos{i}_sw_tool", "")
+            end_tool = st.session_state.get(POS_KEYS[i]["ew_tool"], "")
+            side_tool = st.session_state.get(POS_KEYS[i]["sw_tool"], "")
             schematic_station_data.append({
                 "end_operation": end_tool if end_tool.strip() else "",
                 "side_operation": side_tool if side_tool.strip() else ""
@@ -3973,19 +4126,19 @@ def main():
         threading_prompt_from_cam_ops(spindle_data)
 
         # Add summary section showing all effective revolutions
-        if any(st.session_state.get(f"pos{i}_ew_feed", 0) > 0 or st.session_state.get(f"pos{i}_sw_feed", 0) > 0 for i in range(1, num_spindles + 1)):
+        if any(st.session_state.get(POS_KEYS[i]["ew_feed"], 0) > 0 or st.session_state.get(POS_KEYS[i]["sw_feed"], 0) > 0 for i in range(1, num_spindles + 1)):
             st.markdown("---")
             st.markdown("### 📊 **Effective Revolutions Summary**")
             
             # Create summary table
             summary_data = []
             for i in range(1, num_spindles + 1):
-                ew_travel = st.session_state.get(f"pos{i}_ew_travel", 0.0)
-                ew_approach = st.session_state.get(f"pos{i}_ew_approach", 0.0)
-                ew_feed = st.session_state.get(f"pos{i}_ew_feed", 0.0)
-                sw_travel = st.session_state.get(f"pos{i}_sw_travel", 0.0)
-                sw_approach = st.session_state.get(f"pos{i}_sw_approach", 0.0)
-                sw_feed = st.session_state.get(f"pos{i}_sw_feed", 0.0)
+                ew_travel = st.session_state.get(POS_KEYS[i]["ew_travel"], 0.0)
+                ew_approach = st.session_state.get(POS_KEYS[i]["ew_approach"], 0.0)
+                ew_feed = st.session_state.get(POS_KEYS[i]["ew_feed"], 0.0)
+                sw_travel = st.session_state.get(POS_KEYS[i]["sw_travel"], 0.0)
+                sw_approach = st.session_state.get(POS_KEYS[i]["sw_approach"], 0.0)
+                sw_feed = st.session_state.get(POS_KEYS[i]["sw_feed"], 0.0)
                 
                 ew_total = ew_travel + ew_approach
                 sw_total = sw_travel + sw_approach
@@ -4003,9 +4156,7 @@ def main():
                     })
             
             if summary_data:
-                import pandas as pd
-                df = pd.DataFrame(summary_data)
-                st.dataframe(df, use_container_width=True)
+                st.dataframe(summary_data, use_container_width=True)
                 
                 # Show the critical position info more subtly
                 critical_positions = [row for row in summary_data if "🎯 YES" in row["Is Critical"]]
@@ -4040,8 +4191,8 @@ def main():
             
             if cycle_rate_results:
                 # Find best production rate
-                best_production = max(cycle_rate_results, key=lambda x: x['production_per_hour'])
-                best_match = min(cycle_rate_results, key=lambda x: x['revs_match'])
+                best_production = max(cycle_rate_results, key=itemgetter('production_per_hour'))
+                best_match = min(cycle_rate_results, key=itemgetter('revs_match'))
                 
                 st.markdown("#### 📊 **Cycle Rate Comparison**")
                 
@@ -4070,9 +4221,7 @@ def main():
                     })
                 
                 # Display comparison table
-                import pandas as pd
-                df_comparison = pd.DataFrame(comparison_data)
-                st.dataframe(df_comparison, use_container_width=True)
+                st.dataframe(comparison_data, use_container_width=True)
                 
                 # Recommendation logic
                 if best_production == best_match:
@@ -4234,15 +4383,15 @@ def main():
         cam_ops_data = {}
         for i in range(1, num_spindles + 1):
             # Store end-working data
-            cam_ops_data[f"pos{i}_ew_travel"] = st.session_state.get(f"pos{i}_ew_travel", 0.0)
-            cam_ops_data[f"pos{i}_ew_approach"] = st.session_state.get(f"pos{i}_ew_approach", 0.0)
-            cam_ops_data[f"pos{i}_ew_feed"] = st.session_state.get(f"pos{i}_ew_feed", 0.0)
-            cam_ops_data[f"pos{i}_ew_tool_desc"] = st.session_state.get(f"pos{i}_ew_tool_desc", "")
+            cam_ops_data[POS_KEYS[i]["ew_travel"]] = st.session_state.get(POS_KEYS[i]["ew_travel"], 0.0)
+            cam_ops_data[POS_KEYS[i]["ew_approach"]] = st.session_state.get(POS_KEYS[i]["ew_approach"], 0.0)
+            cam_ops_data[POS_KEYS[i]["ew_feed"]] = st.session_state.get(POS_KEYS[i]["ew_feed"], 0.0)
+            cam_ops_data[POS_KEYS[i]["ew_tool_desc"]] = st.session_state.get(POS_KEYS[i]["ew_tool_desc"], "")
             # Store side-working data
-            cam_ops_data[f"pos{i}_sw_travel"] = st.session_state.get(f"pos{i}_sw_travel", 0.0)
-            cam_ops_data[f"pos{i}_sw_approach"] = st.session_state.get(f"pos{i}_sw_approach", 0.0)
-            cam_ops_data[f"pos{i}_sw_feed"] = st.session_state.get(f"pos{i}_sw_feed", 0.0)
-            cam_ops_data[f"pos{i}_sw_tool_desc"] = st.session_state.get(f"pos{i}_sw_tool_desc", "")
+            cam_ops_data[POS_KEYS[i]["sw_travel"]] = st.session_state.get(POS_KEYS[i]["sw_travel"], 0.0)
+            cam_ops_data[POS_KEYS[i]["sw_approach"]] = st.session_state.get(POS_KEYS[i]["sw_approach"], 0.0)
+            cam_ops_data[POS_KEYS[i]["sw_feed"]] = st.session_state.get(POS_KEYS[i]["sw_feed"], 0.0)
+            cam_ops_data[POS_KEYS[i]["sw_tool_desc"]] = st.session_state.get(POS_KEYS[i]["sw_tool_desc"], "")
         st.session_state["cam_operations_data"] = cam_ops_data
         st.session_state["last_spindle_data"] = spindle_data
 
@@ -4287,8 +4436,8 @@ def main():
         
         simulation_section(setup_data, spindle_data, machine_config)
 
-        with tab5:
-                reference_charts_section()
+    with tab5:
+        reference_charts_section()
         
         # Placeholder sections for future reference charts
         st.markdown("### Planned Reference Charts:")